@@ -1,6 +1,5 @@
 """Binaries"""
 from __future__ import print_function
-from collections import defaultdict
 
 import sys
 
@@ -20,22 +19,13 @@ def print_table(rows, headers=None, space_between_columns=4):
 
         space_between_columns - The amount of space between the columns of text. Defaults to 4.
     """
-    columns_to_sizing = defaultdict(int)
-    format_string = ''
-
     headers = headers or rows[0].keys()
 
-    for row in rows:
-        for header in headers:
-            value = row.get(header, '-')
-            columns_to_sizing[header] = max(len(str(value)), columns_to_sizing[header])
-
-    for header in headers:
-        column_size = max(columns_to_sizing[header], len(header)) + space_between_columns
-        format_string += '{' + header + ':<' + str(column_size) + '}'
+    table = [[str(row.get(header) or '-') for header in headers] for row in rows]
+    # Transpose the header and rows into columns so each width is a single max over its cells
+    column_sizes = [max(map(len, column)) + space_between_columns for column in zip(headers, *table)]
 
-    print(format_string.format(**{key: key for key in headers}), file=sys.stderr)
+    print(''.join(header.ljust(size) for header, size in zip(headers, column_sizes)), file=sys.stderr)
 
-    for row in rows:
-        defaulted_row = {header: row.get(header) or '-' for header in headers}
-        print(format_string.format(**defaulted_row))
+    for line in table:
+        print(''.join(value.ljust(size) for value, size in zip(line, column_sizes)))
@@ -6,6 +6,7 @@ Command line tool for working with autoscaling groups and launch configurations.
 from __future__ import print_function
 
 import argparse
+import re
 import sys
 
 from bin import print_table
@@ -14,6 +15,32 @@ from disco_aws_automation.disco_aws_util import run_gracefully, is_truthy
 from disco_aws_automation.disco_config import read_config
 from disco_aws_automation.disco_logging import configure_logging
 
+STEP_ADJUSTMENT_KEYS = frozenset([
+    'MetricIntervalLowerBound',
+    'MetricIntervalUpperBound',
+    'ScalingAdjustment'
+])
+# Matches one key=value entry of a comma separated step adjustment
+STEP_ADJUSTMENT_ENTRY = re.compile(r'([^,=]+)=([^,]*)$')
+
+
+def parse_step_adjustment(step):
+    """Parses a comma separated list of key=value entries into a step adjustment dict"""
+    parsed_step = {}
+    for entry in step.split(','):
+        match = STEP_ADJUSTMENT_ENTRY.match(entry)
+        if not match:
+            raise Exception(
+                'Unable to parse step {0}, entry {1} is not of the form key=value'.format(step, entry)
+            )
+        key, value = match.groups()
+        if key not in STEP_ADJUSTMENT_KEYS:
+            raise Exception(
+                'Unable to parse step {0}, key {1} not in {2}'.format(step, key, sorted(STEP_ADJUSTMENT_KEYS))
+            )
+        parsed_step[key] = value
+    return parsed_step
+
 
 def parse_arguments():
     """Read in options passed in over command line"""
@@ -148,8 +175,8 @@ def parse_arguments():
 # pylint: disable=R0912, R0914
 def run():
     """Parses command line and dispatches the commands"""
-    config = read_config()
     args = parse_arguments()
+    config = read_config()
     configure_logging(args.debug)
 
     environment_name = args.env or config.get("disco_aws", "default_environment")
@@ -159,11 +186,12 @@ def run():
     # Autoscaling group commands
     if args.mode == "listgroups":
         format_str = "{0} {1:21} {2:3} {3:3} {4:3} {5:3} {6:4} {7:10}"
+        name_width = 40 + len(environment_name)
         groups = discogroup.list_groups()
         if args.debug:
             print(
                 format_str.format(
-                    "Name".ljust(35 + len(environment_name)),
+                    "Name".ljust(name_width),
                     "AMI",
                     "min",
                     "des",
@@ -173,19 +201,21 @@ def run():
                     "is_testing"
                 )
             )
-        for group in groups:
-            print(
-                format_str.format(
-                    group['name'].ljust(40 + len(environment_name)),
-                    group['image_id'],
-                    group['min_size'],
-                    group['desired_capacity'],
-                    group['max_size'],
-                    group['group_cnt'],
-                    group['type'],
-                    'y' if is_truthy(group['tags'].get('is_testing')) else 'n'
-                )
+        row_format = format_str + "\n"
+        lines = [
+            row_format.format(
+                group['name'].ljust(name_width),
+                group['image_id'],
+                group['min_size'],
+                group['desired_capacity'],
+                group['max_size'],
+                group['group_cnt'],
+                group['type'],
+                'y' if is_truthy(group['tags'].get('is_testing')) else 'n'
             )
+            for group in groups
+        ]
+        sys.stdout.writelines(lines)
 
     elif args.mode == "cleangroups":
         discogroup.delete_groups()
@@ -194,8 +224,10 @@ def run():
 
     # Launch Configuration commands
     elif args.mode == "listconfigs":
-        for config in discogroup.get_configs():
-            print("{0:24} {1}".format(config['LaunchConfigurationName'], config['ImageId']))
+        sys.stdout.writelines(
+            "{0:24} {1}\n".format(config['LaunchConfigurationName'], config['ImageId'])
+            for config in discogroup.get_configs()
+        )
     elif args.mode == "cleanconfigs":
         discogroup.clean_configs()
     elif args.mode == "deleteconfig":
@@ -225,21 +257,9 @@ def run():
         )
     elif args.mode == "createpolicy":
         # Parse out the step adjustments, if provided.
-        if args.step_adjustments:
-            allowed_keys = ['MetricIntervalLowerBound', 'MetricIntervalUpperBound', 'ScalingAdjustment']
-            parsed_steps = []
-            for step in args.step_adjustments:
-                parsed_step = {}
-                for entry in step.split(','):
-                    key, value = entry.split('=', 1)
-                    if key not in allowed_keys:
-                        raise Exception(
-                            'Unable to parse step {0}, key {1} not in {2}'.format(step, key, allowed_keys)
-                        )
-                    parsed_step[key] = value
-                parsed_steps.append(parsed_step)
-        else:
-            parsed_steps = []
+        parsed_steps = []
+        for step in args.step_adjustments or []:
+            parsed_steps.append(parse_step_adjustment(step))
 
         discogroup.create_policy(
             group_name=args.group_name,
@@ -53,14 +53,13 @@ Options:
 """
 
 from __future__ import print_function
-import csv
 import logging
 import sys
 
 from docopt import docopt
 
 from disco_aws_automation import DiscoAWS, DiscoGroup, DiscoBake, DiscoDeploy, DiscoELB, DiscoVPC, DiscoSSM
-from disco_aws_automation.disco_aws_util import run_gracefully, is_truthy
+from disco_aws_automation.disco_aws_util import run_gracefully, is_truthy, read_pipeline_file
 from disco_aws_automation.disco_config import read_config
 from disco_aws_automation.disco_logging import configure_logging
 
@@ -68,33 +67,40 @@ from disco_aws_automation.disco_logging import configure_logging
 logger = logging.getLogger(__name__)
 
 
+def print_amis(deploy, amis, missing):
+    """Prints the id, hostclass and integration test of each AMI"""
+    lines = []
+    for ami in amis:
+        hostclass = ami.name.split()[0]
+        integration_test = deploy.get_integration_test(hostclass) or missing
+        lines.append("{} {:40} {}\n".format(ami.id, hostclass, integration_test))
+    sys.stdout.writelines(lines)
+
+
 # R0912 Allow more than 12 branches so we can parse a lot of commands..
 # R0914 Allow more than 15 local variables so we can parse a lot of commands.
 # R0915 Allow more than 50 statements
 # pylint: disable=R0912,R0914,R0915
 def run():
     """Parses command line and dispatches the commands"""
-    config = read_config()
-
     args = docopt(__doc__)
 
+    config = read_config()
+
     configure_logging(args["--debug"])
 
     env = args["--environment"] or config.get("disco_aws", "default_environment")
 
     force_deployable = None if args["--deployable"] is None else is_truthy(args["--deployable"])
 
-    pipeline_definition = []
-    if args["--pipeline"]:
-        with open(args["--pipeline"], "r") as f:
-            reader = csv.DictReader(f)
-            pipeline_definition = [line for line in reader]
+    pipeline_definition = read_pipeline_file(args["--pipeline"]) if args["--pipeline"] else []
 
     aws = DiscoAWS(config, env)
 
-    if config.has_option('test', 'env'):
-        test_env = config.get('test', 'env')
-        test_aws = DiscoAWS(config, test_env)
+    test_env = config.get('test', 'env') if config.has_option('test', 'env') else env
+    if test_env != env:
+        # Share the EC2 connection rather than having the test environment open its own
+        test_aws = DiscoAWS(config, test_env, boto2_conn=aws.connection)
     else:
         test_aws = aws
 
@@ -131,30 +137,18 @@ def run():
     elif args["list"]:
         missing = "-" if pipeline_definition else ""
         if args["--tested"]:
-            for (_hostclass, ami) in deploy.get_latest_tested_amis().iteritems():
-                print("{} {:40} {}".format(
-                    ami.id, ami.name.split()[0], deploy.get_integration_test(ami.name.split()[0]) or missing))
+            print_amis(deploy, deploy.get_latest_tested_amis().values(), missing)
         elif args["--untested"]:
-            for (_hostclass, ami) in deploy.get_latest_untested_amis().iteritems():
-                print("{} {:40} {}".format(
-                    ami.id, ami.name.split()[0], deploy.get_integration_test(ami.name.split()[0]) or missing))
+            print_amis(deploy, deploy.get_latest_untested_amis().values(), missing)
         elif args["--failed"]:
-            for (_hostclass, ami) in deploy.get_latest_failed_amis().iteritems():
-                print("{} {:40} {}".format(
-                    ami.id, ami.name.split()[0], deploy.get_integration_test(ami.name.split()[0]) or missing))
+            print_amis(deploy, deploy.get_latest_failed_amis().values(), missing)
         elif args["--testable"]:
-            for ami in deploy.get_test_amis():
-                print("{} {:40} {}".format(
-                    ami.id, ami.name.split()[0], deploy.get_integration_test(ami.name.split()[0]) or missing))
+            print_amis(deploy, deploy.get_test_amis(), missing)
         elif args["--updatable"]:
-            for ami in deploy.get_update_amis():
-                print("{} {:40} {}".format(
-                    ami.id, ami.name.split()[0], deploy.get_integration_test(ami.name.split()[0]) or missing))
+            print_amis(deploy, deploy.get_update_amis(), missing)
         elif args["--failures"]:
             failures = deploy.get_failed_amis()
-            for ami in failures:
-                print("{} {:40} {}".format(
-                    ami.id, ami.name.split()[0], deploy.get_integration_test(ami.name.split()[0]) or missing))
+            print_amis(deploy, failures, missing)
             sys.exit(1 if failures else 0)
 
 
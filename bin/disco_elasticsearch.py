@@ -98,11 +98,14 @@ def run():
             format_line += u" {3:<80}"
             headers.append("Elastic Search Endpoint")
         print(format_line.format(*headers), file=sys.stderr)
+        lines = []
         for entry in entries:
             values = [entry["elasticsearch_domain_name"], entry["internal_name"], entry["route_53_endpoint"]]
             if args.endpoint:
                 values.append(entry["elasticsearch_endpoint"] or u"-")
-            print(format_line.format(*values))
+            lines.append(format_line.format(*values))
+        if lines:
+            sys.stdout.write(u"\n".join(lines) + u"\n")
     elif args.mode == "update":
         if args.names:
             for name in args.names:
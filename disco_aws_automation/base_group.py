@@ -143,18 +143,37 @@ class BaseGroup(object):
 
     def wait_instance_termination(self, group_name=None, group=None, noerror=False):
         """Wait for instance to be terminated during scaledown"""
-        instance_ids = [inst['instance_id'] for inst in self.get_instances(group_name=group_name)]
+        if group is None:
+            if group_name is None:
+                raise ValueError("Either group_name or group must be given")
+            group = {'name': group_name}
+        return self.wait_groups_termination([group], noerror=noerror)
+
+    def wait_groups_termination(self, groups, noerror=False):
+        """Wait for the instances of all the given groups to be terminated during scaledown"""
+        # Only wait on the groups being scaled down, even when the caller selected groups by hostclass.
+        # Autoscaling groups already list their instances, so only look them up for other groups.
+        instance_ids = []
+        for group in groups:
+            group_instance_ids = group.get('instance_ids')
+            if group_instance_ids is None:
+                group_instance_ids = [
+                    inst['instance_id'] for inst in self.get_instances(group_name=group['name'])
+                ]
+            instance_ids.extend(group_instance_ids)
 
         # don't wait if there are no instances to wait for
         if not instance_ids:
             return True
 
+        group_names = [group['name'] for group in groups]
         try:
-            logger.info("Waiting for scaledown of group %s, instances %s", group['name'], instance_ids)
+            # A single waiter polls for every instance, instead of one polling loop per group
+            logger.info("Waiting for scaledown of groups %s, instances %s", group_names, instance_ids)
             throttled_call(self.boto3_ec.get_waiter('instance_terminated').wait, InstanceIds=instance_ids)
         except WaiterError:
             if noerror:
-                logger.exception("Unable to wait for scaling down of %s", group_name)
+                logger.exception("Unable to wait for scaling down of %s", group_names)
                 return False
             else:
                 raise
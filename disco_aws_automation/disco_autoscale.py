@@ -1,11 +1,14 @@
 """Contains DiscoAutoscale class that orchestrates AWS Autoscaling"""
 from base64 import b64decode
+from collections import Counter
+from multiprocessing.pool import ThreadPool
 
 import logging
-import random
 import time
+import uuid
 
 import botocore
+from botocore.config import Config
 import boto3
 
 from .base_group import BaseGroup
@@ -16,6 +19,44 @@ logger = logging.getLogger(__name__)
 
 
 DEFAULT_TERMINATION_POLICIES = ["OldestLaunchConfiguration"]
+# Cooldown create_policy uses for simple scaling policies unless told otherwise
+DEFAULT_POLICY_COOLDOWN = 600
+# Scaling policies every group gets, as create_policy arguments
+DEFAULT_SCALING_POLICIES = [
+    {
+        'policy_name': 'up',
+        'policy_type': 'SimpleScaling',
+        'adjustment_type': 'PercentChangeInCapacity',
+        'scaling_adjustment': '10',
+        'min_adjustment_magnitude': '1'
+    },
+    {
+        'policy_name': 'down',
+        'policy_type': 'SimpleScaling',
+        'adjustment_type': 'PercentChangeInCapacity',
+        'scaling_adjustment': '-10',
+        'min_adjustment_magnitude': '1'
+    }
+]
+# Most autoscaling API calls made at once when working through many groups
+MAX_CONCURRENT_CALLS = 20
+# Most launch configuration names DescribeLaunchConfigurations accepts in one call
+LAUNCH_CONFIG_NAMES_PER_CALL = 50
+# Largest page DescribeAutoScalingGroups, DescribeLaunchConfigurations and DescribeScheduledActions return
+MAX_PAGE_SIZE = 100
+# Seconds a looked up group is reused by the update_* methods before it is described again
+GROUP_CACHE_TTL = 30
+
+
+def _client_config():
+    """
+    Returns the autoscaling client config. Adaptive retries rate limit our own calls when the account's
+    autoscaling API is being throttled, but older botocore versions don't know about retry modes.
+    """
+    try:
+        return Config(max_pool_connections=MAX_CONCURRENT_CALLS, retries={'mode': 'adaptive'})
+    except botocore.exceptions.InvalidRetryConfigurationError:
+        return Config(max_pool_connections=MAX_CONCURRENT_CALLS)
 
 
 class DiscoAutoscale(BaseGroup):
@@ -23,69 +64,76 @@ class DiscoAutoscale(BaseGroup):
 
     def __init__(self, environment_name, boto3_autoscaling_connection=None):
         self.environment_name = environment_name
-        self.boto3_autoscale = boto3_autoscaling_connection or boto3.client('autoscaling')
+        # Names of groups and launch configs in this environment all start with this prefix
+        self._env_prefix = environment_name + '_'
+        # Keep enough pooled connections for every call a thread pool of ours can make at once
+        self.boto3_autoscale = boto3_autoscaling_connection or boto3.client(
+            'autoscaling', config=_client_config()
+        )
+        # (hostclass, group_name) -> (lookup time, group) for the update_* methods
+        self._group_cache = {}
+        # (hostclass, group_name) -> (lookup time, snapshot ID) of groups seen by update_snapshot
+        self._snapshot_ids = {}
+        # Launch configs can't be modified, so once described they can be reused until deleted
+        self._launch_configs = {}
+        # Launch config name -> its decoded user data
+        self._user_data = {}
         super(DiscoAutoscale, self).__init__()
 
     def get_new_groupname(self, hostclass):
         """Returns a new autoscaling group name when given a hostclass"""
-        return self.environment_name + '_' + hostclass + "_" + str(int(time.time()))
+        # Millisecond timestamps keep newer groups sorting after older ones, including ones named in seconds
+        return self._env_prefix + hostclass + "_" + str(int(time.time() * 1000))
 
     def get_launch_config_name(self, hostclass):
         """Create new launchconfig group name"""
-        return '{0}_{1}_{2}'.format(self.environment_name, hostclass, str(random.randrange(0, 9999999)))
+        return self._env_prefix + hostclass + '_' + uuid.uuid4().hex[:10]
 
     def _filter_launch_configs_by_environment(self, items):
         """Filters launch configs by environment"""
-        for item in items:
-            try:
-                if item['LaunchConfigurationName'].startswith("{0}_".format(self.environment_name)):
-                    yield item
-            except AttributeError:
-                logger.warning("Skipping unparseable item=%s", vars(item))
+        prefix = self._env_prefix
+        return [item for item in items if item['LaunchConfigurationName'].startswith(prefix)]
 
     def _filter_autoscale_by_environment(self, items):
         """Filters autoscaling groups by environment ONLY BOTO3"""
-        for item in items:
-            try:
-                if item['AutoScalingGroupName'].startswith("{0}_".format(self.environment_name)):
-                    yield item
-            except AttributeError:
-                logger.warning("Skipping unparseable item=%s", vars(item))
+        prefix = self._env_prefix
+        return [item for item in items if item['AutoScalingGroupName'].startswith(prefix)]
 
     def _filter_instance_by_environment(self, items):
         """Filter instances by environment via their group_name"""
-        for item in items:
-            try:
-                if item['AutoScalingGroupName'].startswith("{0}_".format(self.environment_name)):
-                    yield item
-            except AttributeError:
-                logger.warning("Skipping unparseable item=%s", vars(item))
+        prefix = self._env_prefix
+        return [item for item in items if item['AutoScalingGroupName'].startswith(prefix)]
 
     def _get_hostclass(self, groupname):
         """Returns the hostclass when given an autoscaling group name"""
         # group names follow a <env>_hostclass_<id> pattern. hostclass names could have underscores
         # so we need to be careful about how we split out the hostclass name
-        parts = groupname.split('_')[1:-1]
-        return '_'.join(parts)
+        start = groupname.find('_') + 1
+        end = groupname.rfind('_')
+        return groupname[start:end] if start <= end else ''
 
-    def _get_group_generator(self, group_names=None):
-        """Yields groups in current environment"""
-        if group_names and group_names[0] is not None:
+    def _get_group_generator(self, group_names=None, include_tags=False):
+        """
+        Yields groups in current environment. Tags are only converted into a dict when include_tags is True.
+        """
+        if group_names:
             groups = get_boto3_paged_results(
                 self.boto3_autoscale.describe_auto_scaling_groups,
                 results_key='AutoScalingGroups',
                 next_token_key='NextToken',
-                AutoScalingGroupNames=group_names
+                AutoScalingGroupNames=group_names,
+                MaxRecords=MAX_PAGE_SIZE
             )
         else:
             groups = get_boto3_paged_results(
                 self.boto3_autoscale.describe_auto_scaling_groups,
                 results_key='AutoScalingGroups',
-                next_token_key='NextToken'
+                next_token_key='NextToken',
+                MaxRecords=MAX_PAGE_SIZE
             )
 
         for group in self._filter_autoscale_by_environment(groups):
-            yield {
+            group_dict = {
                 'name': group.get('AutoScalingGroupName'),
                 'min_size': group.get('MinSize'),
                 'max_size': group.get('MaxSize'),
@@ -95,9 +143,12 @@ class DiscoAutoscale(BaseGroup):
                 'vpc_zone_identifier': group.get('VPCZoneIdentifier'),
                 'load_balancers': group.get('LoadBalancerNames'),
                 'target_groups': group.get('TargetGroupARNs'),
-                'type': 'asg',
-                'tags': tag2dict(group.get('Tags'))
+                'instance_ids': [instance['InstanceId'] for instance in group.get('Instances', [])],
+                'type': 'asg'
             }
+            if include_tags:
+                group_dict['tags'] = tag2dict(group.get('Tags'))
+            yield group_dict
 
     def get_instances(self, hostclass=None, group_name=None):
         """Returns autoscaled instances in the current environment"""
@@ -108,14 +159,12 @@ class DiscoAutoscale(BaseGroup):
 
         instance_info = []
         for instance in self._filter_instance_by_environment(instances):
-            filters = [
-                not hostclass or self._get_hostclass(instance['AutoScalingGroupName']) == hostclass,
-                not group_name or instance['AutoScalingGroupName'] == group_name
-            ]
-            if all(filters):
+            instance_group_name = instance['AutoScalingGroupName']
+            if (not group_name or instance_group_name == group_name) and \
+                    (not hostclass or self._get_hostclass(instance_group_name) == hostclass):
                 instance_info.append({
                     'instance_id': instance['InstanceId'],
-                    'group_name': instance['AutoScalingGroupName']
+                    'group_name': instance_group_name
                 })
 
         return instance_info
@@ -125,10 +174,11 @@ class DiscoAutoscale(BaseGroup):
         configs = get_boto3_paged_results(
             func=self.boto3_autoscale.describe_launch_configurations,
             LaunchConfigurationNames=names or [],
-            results_key='LaunchConfigurations'
+            results_key='LaunchConfigurations',
+            MaxRecords=MAX_PAGE_SIZE
         )
 
-        return list(self._filter_launch_configs_by_environment(configs))
+        return self._filter_launch_configs_by_environment(configs)
 
     # pylint: disable=too-many-arguments
     def _create_launch_config(
@@ -136,22 +186,22 @@ class DiscoAutoscale(BaseGroup):
             instance_monitoring, instance_profile_name, ebs_optimized, user_data, associate_public_ip_address,
             key_name=None
     ):
-        """Creates a new launch configuration"""
+        """Creates a new launch configuration and returns the parameters it was created with"""
         create_kwargs = {
             'LaunchConfigurationName': name,
             'ImageId': image_id,
             'SecurityGroups': security_groups,
             'BlockDeviceMappings': block_device_mappings,
             'InstanceType': instance_type,
-            'InstanceMonitoring': {'Enabled': instance_monitoring},
+            'InstanceMonitoring': {'Enabled': bool(instance_monitoring)},
             'IamInstanceProfile': instance_profile_name,
             'EbsOptimized': ebs_optimized,
             'UserData': user_data,
-            'AssociatePublicIpAddress': associate_public_ip_address
+            'AssociatePublicIpAddress': associate_public_ip_address,
+            'KeyName': key_name or None
         }
-
-        if key_name:
-            create_kwargs['KeyName'] = key_name
+        # boto3 rejects None for any parameter, so leave unset ones out and let AWS use its defaults
+        create_kwargs = {key: value for key, value in create_kwargs.items() if value is not None}
 
         logger.info('Creating launch configuration %s', name)
         logger.debug("Launch configuration parameters: %s", create_kwargs)
@@ -160,23 +210,19 @@ class DiscoAutoscale(BaseGroup):
             **create_kwargs
         )
 
-        return throttled_call(
-            self.boto3_autoscale.describe_launch_configurations,
-            LaunchConfigurationNames=[
-                name
-            ]
-        ).get('LaunchConfigurations', [])[0]
+        # Callers only need the name, so avoid describing the launch config we just created
+        return create_kwargs
 
     def _boto2_block_device_mappings_to_boto3(self, block_device_mappings):
         boto3_block_device_mappings = []
         for block_device_mapping in block_device_mappings:
-            for name, device in block_device_mapping.iteritems():
+            for name, device in block_device_mapping.items():
                 if device.ephemeral_name:
                     boto3_block_device_mappings.append({
                         'DeviceName': name,
                         'VirtualName': device.ephemeral_name
                     })
-                elif any([device.size, device.iops, device.snapshot_id]):
+                elif device.size or device.iops or device.snapshot_id:
                     device_mapping = {
                         'DeviceName': name,
                         'Ebs': {
@@ -202,16 +248,34 @@ class DiscoAutoscale(BaseGroup):
             self.boto3_autoscale.delete_launch_configuration,
             LaunchConfigurationName=config_name
         )
+        self._launch_configs.pop(config_name, None)
+        self._user_data.pop(config_name, None)
         logger.info("Deleting launch configuration %s", config_name)
 
     def clean_configs(self):
         """Delete unused Launch Configurations in current environment"""
         logger.info("Cleaning up unused launch configurations in %s", self.environment_name)
-        for config in self.get_configs():
-            try:
-                self.delete_config(config['LaunchConfigurationName'])
-            except botocore.exceptions.ClientError as ex:
-                logger.warning('Error while deleting %s: %s', config['LaunchConfigurationName'], ex.message)
+        # Launch configs still used by a group can't be deleted, so don't ask AWS to try
+        used_names = set(group['launch_config_name'] for group in self.get_existing_groups())
+        unused_names = [config['LaunchConfigurationName'] for config in self.get_configs()
+                        if config['LaunchConfigurationName'] not in used_names]
+        if not unused_names:
+            return
+
+        # Each launch config is deleted independently, so delete them concurrently
+        pool = ThreadPool(min(len(unused_names), MAX_CONCURRENT_CALLS))
+        try:
+            pool.map(self._clean_config, unused_names)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _clean_config(self, config_name):
+        """Deletes a launch configuration, logging rather than raising errors"""
+        try:
+            self.delete_config(config_name)
+        except botocore.exceptions.ClientError as ex:
+            logger.warning('Error while deleting %s: %s', config_name, ex.message)
 
     def delete_groups(self, hostclass=None, group_name=None, force=False):
         """
@@ -221,19 +285,37 @@ class DiscoAutoscale(BaseGroup):
         Defaults to False.
         """
         groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
-        for group in groups:
-            try:
-                logger.info("Deleting group %s", group['name'])
-                throttled_call(
-                    self.boto3_autoscale.delete_auto_scaling_group,
-                    AutoScalingGroupName=group['name'],
-                    ForceDelete=force
-                )
-
-                self.delete_config(group['launch_config_name'])
-            except botocore.exceptions.ClientError as exc:
-                logger.info("Unable to delete group %s due to: %s. Force delete is set to %s",
-                            group['name'], exc.message, force)
+        if not groups:
+            return
+
+        self.invalidate_group_cache()
+        # Groups are deleted independently of each other, so delete them concurrently
+        pool = ThreadPool(min(len(groups), MAX_CONCURRENT_CALLS))
+        try:
+            deleted = pool.map(lambda group: self._delete_group(group, force), groups)
+            # A launch config can't be deleted while a group uses it, so delete the configs once all the
+            # groups are gone. Groups sharing a config only need it deleted once.
+            config_names = set(group['launch_config_name']
+                               for group, was_deleted in zip(groups, deleted) if was_deleted)
+            pool.map(self._clean_config, config_names)
+        finally:
+            pool.close()
+            pool.join()
+
+    def _delete_group(self, group, force):
+        """Deletes an autoscaling group, returning whether it was deleted"""
+        try:
+            logger.info("Deleting group %s", group['name'])
+            throttled_call(
+                self.boto3_autoscale.delete_auto_scaling_group,
+                AutoScalingGroupName=group['name'],
+                ForceDelete=force
+            )
+            return True
+        except botocore.exceptions.ClientError as exc:
+            logger.info("Unable to delete group %s due to: %s. Force delete is set to %s",
+                        group['name'], exc.message, force)
+            return False
 
     def scaledown_groups(self, hostclass=None, group_name=None, wait=False, noerror=False):
         """
@@ -244,18 +326,19 @@ class DiscoAutoscale(BaseGroup):
         Returns true if the autoscaling groups were successfully scaled down, False otherwise.
         """
         groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
+        self.invalidate_group_cache()
         for group in groups:
             logger.info("Scaling down group %s", group['name'])
-            throttled_call(
-                self.boto3_autoscale.update_auto_scaling_group,
-                AutoScalingGroupName=group['name'],
-                MaxSize=0,
-                MinSize=0,
-                DesiredCapacity=0
-            )
+        self._throttled_calls([
+            (self.boto3_autoscale.update_auto_scaling_group,
+             {'AutoScalingGroupName': group['name'], 'MaxSize': 0, 'MinSize': 0, 'DesiredCapacity': 0})
+            for group in groups
+        ])
+
+        if wait:
+            return self.wait_groups_termination(groups, noerror=noerror)
 
-            if wait:
-                self.wait_instance_termination(group_name=group_name, group=group, noerror=noerror)
+        return True
 
     @staticmethod
     def _tag_dict_to_autoscale_tags(group_name, tags):
@@ -265,10 +348,10 @@ class DiscoAutoscale(BaseGroup):
                 'ResourceId': group_name,
                 'ResourceType': 'auto-scaling-group',
                 'Key': key,
-                'Value': str(value),
+                'Value': value if isinstance(value, str) else str(value),
                 'PropagateAtLaunch': True
             }
-            for key, value in tags.iteritems()
+            for key, value in tags.items()
         ] if tags else None
 
     def modify_group(self, group, launch_config, vpc_zone_id=None,
@@ -277,41 +360,49 @@ class DiscoAutoscale(BaseGroup):
                      load_balancers=None, target_groups=None):
         """Update an existing autoscaling group"""
         # pylint: disable=R0913
-        group['launch_config_name'] = launch_config
-        changes = {'LaunchConfigurationName': launch_config}
-        if vpc_zone_id:
-            group['vpc_zone_identifier'] = vpc_zone_id
-            changes['VPCZoneIdentifier'] = vpc_zone_id
-        if min_size is not None:
-            group['min_size'] = min_size
-            changes['MinSize'] = min_size
-        if max_size is not None:
-            group['max_size'] = max_size
-            changes['MaxSize'] = max_size
-        if desired_size is not None:
-            group['desired_capacity'] = desired_size
-            changes['DesiredCapacity'] = desired_size
-        if termination_policies:
-            group['termination_policies'] = termination_policies
-            changes['TerminationPolicies'] = termination_policies
-
-        logger.info('Modifying autoscaling group %s', group['name'])
-        throttled_call(
-            self.boto3_autoscale.update_auto_scaling_group,
-            AutoScalingGroupName=group['name'],
-            **changes
-        )
-
-        if tags:
+        wanted = [
+            ('launch_config_name', 'LaunchConfigurationName', launch_config),
+            ('vpc_zone_identifier', 'VPCZoneIdentifier', vpc_zone_id or None),
+            ('min_size', 'MinSize', min_size),
+            ('max_size', 'MaxSize', max_size),
+            ('desired_capacity', 'DesiredCapacity', desired_size),
+            ('termination_policies', 'TerminationPolicies', termination_policies or None)
+        ]
+        # Only send the settings that differ from what the group already has
+        changes = {}
+        for key, request_key, value in wanted:
+            if value is not None and group.get(key) != value:
+                group[key] = value
+                changes[request_key] = value
+
+        if changes:
+            logger.info('Modifying autoscaling group %s', group['name'])
+            throttled_call(
+                self.boto3_autoscale.update_auto_scaling_group,
+                AutoScalingGroupName=group['name'],
+                **changes
+            )
+        else:
+            logger.debug('Autoscaling group %s is up to date', group['name'])
+        # The group now holds the changes we just made, so later lookups within the TTL can reuse it
+        self.invalidate_group_cache(group_name=group['name'])
+        self._cache_group(group, group_name=group['name'])
+
+        # Groups looked up without their tags always get the given tags written
+        current_tags = group.get('tags')
+        changed_tags = tags if current_tags is None else {
+            key: value for key, value in (tags or {}).items() if current_tags.get(key) != str(value)
+        }
+        if changed_tags:
             throttled_call(
                 self.boto3_autoscale.create_or_update_tags,
-                Tags=DiscoAutoscale._tag_dict_to_autoscale_tags(group['name'], tags)
+                Tags=DiscoAutoscale._tag_dict_to_autoscale_tags(group['name'], changed_tags)
             )
-        if target_groups:
-            self.update_tg(target_groups=target_groups, group_name=group['name'])
-
-        if load_balancers:
-            self.update_elb(elb_names=load_balancers, group_name=group['name'])
+            if current_tags is not None:
+                current_tags.update({key: str(value) for key, value in changed_tags.items()})
+        if target_groups or load_balancers:
+            self.update_load_targets(elb_names=load_balancers or None, target_groups=target_groups or None,
+                                     group_name=group['name'], group=group)
 
         return group
 
@@ -352,6 +443,7 @@ class DiscoAutoscale(BaseGroup):
             self.boto3_autoscale.create_auto_scaling_group,
             **create_kwargs
         )
+        self.invalidate_group_cache()
 
         return self.get_existing_group(hostclass, group_name)
 
@@ -369,8 +461,11 @@ class DiscoAutoscale(BaseGroup):
         NOTE: Deleting tags is not currently supported.
         """
         # Check if an autoscaling group already exists.
-        existing_group = self.get_existing_group(hostclass=hostclass, group_name=group_name)
-        if create_if_exists or not existing_group:
+        # Look the tags up too, so that modify_group only writes the tags that changed
+        existing_group = self.get_existing_group(hostclass=hostclass, group_name=group_name,
+                                                 include_tags=bool(tags))
+        is_new_group = create_if_exists or not existing_group
+        if is_new_group:
             group = self.create_group(
                 hostclass=hostclass, launch_config=launch_config, vpc_zone_id=vpc_zone_id,
                 min_size=min_size, max_size=max_size, desired_size=desired_size,
@@ -383,25 +478,45 @@ class DiscoAutoscale(BaseGroup):
                 termination_policies=termination_policies, tags=tags, load_balancers=load_balancers,
                 target_groups=target_groups)
 
-        # Create default scaling policies
-        self.create_policy(
-            group_name=group['name'],
-            policy_name='up',
-            policy_type='SimpleScaling',
-            adjustment_type='PercentChangeInCapacity',
-            scaling_adjustment='10',
-            min_adjustment_magnitude='1'
-        )
-        self.create_policy(
-            group_name=group['name'],
-            policy_name='down',
-            policy_type='SimpleScaling',
-            adjustment_type='PercentChangeInCapacity',
-            scaling_adjustment='-10',
-            min_adjustment_magnitude='1'
-        )
+        # Create default scaling policies, a freshly created group can't have any yet
+        self._create_default_policies(group['name'], check_existing=not is_new_group)
         return group
 
+    def _create_default_policies(self, group_name, check_existing=True):
+        """
+        Creates the default scaling policies of an autoscaling group. When check_existing is True,
+        policies that already exist with the default settings are left alone.
+        """
+        existing_policies = {}
+        if check_existing:
+            response = throttled_call(
+                self.boto3_autoscale.describe_policies,
+                AutoScalingGroupName=group_name,
+                PolicyNames=[policy['policy_name'] for policy in DEFAULT_SCALING_POLICIES]
+            )
+            existing_policies = {
+                policy['PolicyName']: policy for policy in response.get('ScalingPolicies', [])
+            }
+
+        puts = []
+        for policy in DEFAULT_SCALING_POLICIES:
+            existing = existing_policies.get(policy['policy_name'])
+            if (existing and
+                    existing.get('PolicyType') == policy['policy_type'] and
+                    existing.get('AdjustmentType') == policy['adjustment_type'] and
+                    existing.get('ScalingAdjustment') == int(policy['scaling_adjustment']) and
+                    existing.get('MinAdjustmentMagnitude') == int(policy['min_adjustment_magnitude']) and
+                    existing.get('Cooldown') == DEFAULT_POLICY_COOLDOWN):
+                logger.debug("Scaling policy %s of group %s is up to date", policy['policy_name'], group_name)
+                continue
+            logger.info("Creating autoscaling policy '%s' in autoscaling group '%s'",
+                        policy['policy_name'], group_name)
+            puts.append((self.boto3_autoscale.put_scaling_policy,
+                         DiscoAutoscale._policy_arguments(group_name=group_name, **policy)))
+
+        # The policies are independent of each other, so put them at the same time
+        self._throttled_calls(puts)
+
     def create_or_update_group(self, hostclass, desired_size=None, min_size=None, max_size=None,
                                instance_type=None, load_balancers=None, target_groups=None, subnets=None,
                                security_groups=None, instance_monitoring=None, ebs_optimized=None,
@@ -425,7 +540,7 @@ class DiscoAutoscale(BaseGroup):
             key_name=key_name,
             security_groups=security_groups,
             block_device_mappings=self._boto2_block_device_mappings_to_boto3(block_device_mappings),
-            instance_type=instance_type.split(':')[0],
+            instance_type=instance_type.partition(':')[0],
             instance_monitoring=instance_monitoring,
             instance_profile_name=instance_profile_name,
             ebs_optimized=ebs_optimized,
@@ -436,7 +551,7 @@ class DiscoAutoscale(BaseGroup):
         group = self.get_group(
             hostclass=hostclass,
             launch_config=launch_config['LaunchConfigurationName'],
-            vpc_zone_id=",".join([subnet['SubnetId'] for subnet in subnets]),
+            vpc_zone_id=",".join(subnet['SubnetId'] for subnet in subnets),
             min_size=min_size,
             max_size=max_size,
             desired_size=desired_size,
@@ -450,28 +565,87 @@ class DiscoAutoscale(BaseGroup):
 
         return {'name': group['name']}
 
-    def get_existing_groups(self, hostclass=None, group_name=None):
+    def get_existing_groups(self, hostclass=None, group_name=None, include_tags=False):
         """
         Returns all autoscaling groups for a given hostclass, sorted by most recent creation. If no
-        autoscaling groups can be found, returns an empty list.
+        autoscaling groups can be found, returns an empty list. Groups only carry their tags when
+        include_tags is True.
         """
-        groups = list(self._get_group_generator(group_names=[group_name]))
+        if group_name:
+            groups = list(self._get_group_generator(group_names=[group_name], include_tags=include_tags))
+        else:
+            groups = list(self._get_group_generator(include_tags=include_tags))
         filtered_groups = [group for group in groups
                            if not hostclass or self._get_hostclass(group['name']) == hostclass]
         filtered_groups.sort(key=lambda grp: grp['name'], reverse=True)
         return filtered_groups
 
-    def get_existing_group(self, hostclass=None, group_name=None, throw_on_two_groups=True):
+    def _cached_get_existing_groups(self, hostclass=None, group_name=None):
+        """
+        Returns get_existing_groups(hostclass, group_name), reusing a lookup made within the last
+        GROUP_CACHE_TTL seconds
+        """
+        cached = self._group_cache.get((hostclass, group_name))
+        if cached and time.time() - cached[0] < GROUP_CACHE_TTL:
+            return cached[1]
+
+        groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
+        if groups:
+            self._group_cache[(hostclass, group_name)] = (time.time(), groups)
+        return groups
+
+    def _cached_get_existing_group(self, hostclass=None, group_name=None):
+        """
+        Returns get_existing_group(hostclass, group_name), reusing a lookup made within the last
+        GROUP_CACHE_TTL seconds
+        """
+        cached = self._group_cache.get((hostclass, group_name))
+        if cached and time.time() - cached[0] < GROUP_CACHE_TTL:
+            return DiscoAutoscale._select_group(cached[1], hostclass)
+
+        group = self.get_existing_group(hostclass=hostclass, group_name=group_name)
+        if group:
+            self._cache_group(group, hostclass=hostclass, group_name=group_name)
+        return group
+
+    def _cache_group(self, group, hostclass=None, group_name=None):
+        self._group_cache[(hostclass, group_name)] = (time.time(), [group])
+
+    def invalidate_group_cache(self, group_name=None):
+        """
+        Forgets the groups looked up by the update_* methods. When a group_name is given, only the lookups
+        that could have returned that group are forgotten.
+        """
+        if group_name is None:
+            self._group_cache.clear()
+            self._snapshot_ids.clear()
+            return
+
+        hostclass = self._get_hostclass(group_name)
+        for cache in (self._group_cache, self._snapshot_ids):
+            # Iterate over a copy, other threads may be adding lookups of their own groups meanwhile
+            for key in list(cache):
+                if key[1] == group_name or (key[1] is None and key[0] in (None, hostclass)):
+                    cache.pop(key, None)
+
+    def get_existing_group(self, hostclass=None, group_name=None, throw_on_two_groups=True,
+                           include_tags=False):
         """
         Returns the autoscaling group object for the given hostclass or group name, or None if no autoscaling
-        group exists.
+        group exists. The group's tags are included when include_tags is True.
 
         If two or more autoscaling groups exist for a hostclass, then this method will throw an exception,
         unless 'throw_on_two_groups' is False. Then if there are two groups the most recently created
         autoscaling group will be returned. If there are more than two autoscaling groups, this method will
         always throw an exception.
         """
-        groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
+        groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name,
+                                          include_tags=include_tags)
+        return DiscoAutoscale._select_group(groups, hostclass, throw_on_two_groups)
+
+    @staticmethod
+    def _select_group(groups, hostclass, throw_on_two_groups=True):
+        """Picks the group get_existing_group returns out of the groups of a hostclass"""
         if not groups:
             return None
         elif len(groups) == 1 or (len(groups) == 2 and not throw_on_two_groups):
@@ -481,16 +655,27 @@ class DiscoAutoscale(BaseGroup):
 
     def list_groups(self):
         """Returns list of objects for display purposes for all groups"""
-        groups = self.get_existing_groups()
-        instances = self.get_instances()
+        # Groups and instances are independent listings, so fetch them at the same time
+        pool = ThreadPool(2)
+        try:
+            groups_result = pool.apply_async(self.get_existing_groups, kwds={'include_tags': True})
+            instances_result = pool.apply_async(self.get_instances)
+            groups, instances = groups_result.get(), instances_result.get()
+        finally:
+            pool.close()
+            pool.join()
+        # Describe the groups' launch configs in batches rather than making a describe call per group
+        image_ids = {
+            config['LaunchConfigurationName']: config['ImageId']
+            for config in self._get_group_configs(groups)
+        }
+        instance_counts = Counter(instance['group_name'] for instance in instances)
         grp_list = []
         for group in groups:
-            launch_cfg = list(self.get_configs(names=[group['launch_config_name']]))
             grp_dict = {
                 'name': group['name'].ljust(35 + len(self.environment_name)),
-                'image_id': launch_cfg[0]['ImageId'] if launch_cfg else '',
-                'group_cnt': len([instance for instance in instances
-                                  if instance['group_name'] == group['name']]),
+                'image_id': image_ids.get(group['launch_config_name'], ''),
+                'group_cnt': instance_counts[group['name']],
                 'min_size': group['min_size'],
                 'desired_capacity': group['desired_capacity'],
                 'max_size': group['max_size'],
@@ -513,15 +698,24 @@ class DiscoAutoscale(BaseGroup):
             ShouldDecrementDesiredCapacity=decrement_capacity
         )
 
+    def _get_group_configs(self, groups):
+        """
+        Returns the launch configurations used by the given groups, describing at most
+        LAUNCH_CONFIG_NAMES_PER_CALL of them per call
+        """
+        names = [group['launch_config_name'] for group in groups if group['launch_config_name']]
+        missing_names = [name for name in names if name not in self._launch_configs]
+        # An empty list of names would describe every launch config, so only describe non-empty batches
+        for start in range(0, len(missing_names), LAUNCH_CONFIG_NAMES_PER_CALL):
+            for config in self.get_configs(names=missing_names[start:start + LAUNCH_CONFIG_NAMES_PER_CALL]):
+                self._launch_configs[config['LaunchConfigurationName']] = config
+        return [self._launch_configs[name] for name in names if name in self._launch_configs]
+
     def get_launch_configs(self, hostclass=None, group_name=None):
         """Returns all launch configurations for a hostclass if any exist, None otherwise"""
         group_list = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
         if group_list:
-            return self.get_configs(names=[
-                group['launch_config_name']
-                for group in group_list
-                if group['launch_config_name']
-            ])
+            return self._get_group_configs(group_list)
         return None
 
     def get_launch_config(self, hostclass=None, group_name=None):
@@ -535,8 +729,16 @@ class DiscoAutoscale(BaseGroup):
 
         return None
 
-    def _get_launch_config(self, hostclass=None, group_name=None):
-        config_list = self.get_launch_configs(hostclass=hostclass, group_name=group_name)
+    def _get_launch_config(self, hostclass=None, group_name=None, use_cache=False):
+        if use_cache:
+            # update_snapshot looks the groups up again right after this, so share the lookup with it
+            group_list = self._cached_get_existing_groups(hostclass=hostclass, group_name=group_name)
+            config_list = self._get_group_configs(group_list) if group_list else None
+        else:
+            group_list = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
+            names = [group['launch_config_name'] for group in group_list if group['launch_config_name']]
+            # An empty list of names would describe every launch config
+            config_list = self.get_configs(names=names) if names else None
         return config_list[0] if config_list else None
 
     def list_policies(self, group_name=None, policy_types=None, policy_names=None):
@@ -549,24 +751,18 @@ class DiscoAutoscale(BaseGroup):
         if policy_names:
             arguments["PolicyNames"] = policy_names
 
-        results = throttled_call(self.boto3_autoscale.describe_policies, **arguments)
-        next_token = results.get('NextToken')
-
-        # Next token will be an empty string if we're done
-        while next_token:
-            # Get additional results
-            arguments['NextToken'] = next_token
-            additional_results = throttled_call(self.boto3_autoscale.describe_policies, **arguments)
-
-            # Extend the existing results and setup the next token for another iteration
-            results['ScalingPolicies'] += additional_results['ScalingPolicies']
-            next_token = additional_results.get('NextToken')
+        scaling_policies = get_boto3_paged_results(
+            self.boto3_autoscale.describe_policies,
+            results_key='ScalingPolicies',
+            next_token_key='NextToken',
+            **arguments
+        )
 
         policies = []
 
-        for result in results['ScalingPolicies']:
+        for result in scaling_policies:
             group_name = result['AutoScalingGroupName']
-            if group_name.startswith(self.environment_name):
+            if group_name.startswith(self._env_prefix):
                 # The usage of 'or' is because those keys are present but sometimes contain empty values, so
                 # its needed to use 'or' to make sure that those empty values become our conventionally
                 # accepted '-' empty values.
@@ -585,23 +781,22 @@ class DiscoAutoscale(BaseGroup):
 
         return policies
 
-    def create_policy(
-            self,
+    @staticmethod
+    def _policy_arguments(
             group_name,
             policy_name,
             policy_type="SimpleScaling",
             adjustment_type=None,
             min_adjustment_magnitude=None,
             scaling_adjustment=None,
-            cooldown=600,
+            cooldown=DEFAULT_POLICY_COOLDOWN,
             metric_aggregation_type=None,
             step_adjustments=None,
             estimated_instance_warmup=None
     ):
         """
-        Creates a new autoscaling policy, or updates an existing one if the autoscaling group name and
-        policy name already exist. Handles the logic of constructing the correct autoscaling policy request,
-        because not all parameters are required.
+        Handles the logic of constructing the correct autoscaling policy request, because not all
+        parameters are required.
         """
         arguments = {
             "AutoScalingGroupName": group_name,
@@ -622,6 +817,38 @@ class DiscoAutoscale(BaseGroup):
             arguments["StepAdjustments"] = step_adjustments
             arguments["EstimatedInstanceWarmup"] = int(estimated_instance_warmup)
 
+        return arguments
+
+    def create_policy(
+            self,
+            group_name,
+            policy_name,
+            policy_type="SimpleScaling",
+            adjustment_type=None,
+            min_adjustment_magnitude=None,
+            scaling_adjustment=None,
+            cooldown=DEFAULT_POLICY_COOLDOWN,
+            metric_aggregation_type=None,
+            step_adjustments=None,
+            estimated_instance_warmup=None
+    ):
+        """
+        Creates a new autoscaling policy, or updates an existing one if the autoscaling group name and
+        policy name already exist.
+        """
+        arguments = DiscoAutoscale._policy_arguments(
+            group_name=group_name,
+            policy_name=policy_name,
+            policy_type=policy_type,
+            adjustment_type=adjustment_type,
+            min_adjustment_magnitude=min_adjustment_magnitude,
+            scaling_adjustment=scaling_adjustment,
+            cooldown=cooldown,
+            metric_aggregation_type=metric_aggregation_type,
+            step_adjustments=step_adjustments,
+            estimated_instance_warmup=estimated_instance_warmup
+        )
+
         logger.info(
             "Creating autoscaling policy '%s' in autoscaling group '%s'",
             policy_name,
@@ -640,61 +867,80 @@ class DiscoAutoscale(BaseGroup):
             AutoScalingGroupName=group_name
         )
 
+    def _get_recurring_group_actions(self, group):
+        """Returns the recurring scheduled actions of an autoscaling group"""
+        actions = get_boto3_paged_results(
+            func=self.boto3_autoscale.describe_scheduled_actions,
+            AutoScalingGroupName=group['name'],
+            results_key='ScheduledUpdateGroupActions',
+            MaxRecords=MAX_PAGE_SIZE
+        )
+        return [action for action in actions if action['Recurrence'] is not None]
+
+    def _delete_scheduled_action(self, group_name, action):
+        """Deletes a scheduled action of an autoscaling group"""
+        throttled_call(
+            self.boto3_autoscale.delete_scheduled_action,
+            AutoScalingGroupName=group_name,
+            ScheduledActionName=action['ScheduledActionName']
+        )
+
     def delete_all_recurring_group_actions(self, hostclass=None, group_name=None):
         """Deletes all recurring scheduled actions for a hostclass"""
         groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
-        for group in groups:
-            actions = get_boto3_paged_results(
-                func=self.boto3_autoscale.describe_scheduled_actions,
-                AutoScalingGroupName=group['name'],
-                results_key='ScheduledUpdateGroupActions'
-            )
-            recurring_actions = [action for action in actions if action['Recurrence'] is not None]
-            if recurring_actions:
-                logger.info("Deleting scheduled actions for autoscaling group %s", group['name'])
-                for action in recurring_actions:
-                    throttled_call(
-                        self.boto3_autoscale.delete_scheduled_action,
-                        AutoScalingGroupName=group['name'],
-                        ScheduledActionName=action['ScheduledActionName']
-                    )
+        if not groups:
+            return
+
+        # Each call is a separate round trip, so look up and delete the actions of all groups concurrently
+        pool = ThreadPool(min(len(groups), MAX_CONCURRENT_CALLS))
+        try:
+            deletions = []
+            for group, recurring_actions in zip(groups, pool.map(self._get_recurring_group_actions, groups)):
+                if recurring_actions:
+                    logger.info("Deleting scheduled actions for autoscaling group %s", group['name'])
+                    deletions.extend((group['name'], action) for action in recurring_actions)
+            pool.map(lambda deletion: self._delete_scheduled_action(*deletion), deletions)
+        finally:
+            pool.close()
+            pool.join()
 
     def create_recurring_group_action(self, recurrance, min_size=None, desired_capacity=None, max_size=None,
                                       hostclass=None, group_name=None):
         """Creates a recurring scheduled action for a hostclass"""
         groups = self.get_existing_groups(hostclass=hostclass, group_name=group_name)
+        action_suffix = recurrance.replace('*', 'star').replace(' ', '_')
+        calls = []
         for group in groups:
-            action_name = "{0}_{1}".format(group['name'], recurrance.replace('*', 'star').replace(' ', '_'))
+            action_name = "{0}_{1}".format(group['name'], action_suffix)
             logger.info("Creating scheduled action %s", action_name)
-            throttled_call(
-                self.boto3_autoscale.put_scheduled_update_group_action,
-                AutoScalingGroupName=group['name'],
-                ScheduledActionName=action_name,
-                MinSize=min_size,
-                MaxSize=max_size,
-                DesiredCapacity=desired_capacity,
-                Recurrence=recurrance
-            )
+            calls.append((self.boto3_autoscale.put_scheduled_update_group_action, {
+                'AutoScalingGroupName': group['name'],
+                'ScheduledActionName': action_name,
+                'MinSize': min_size,
+                'MaxSize': max_size,
+                'DesiredCapacity': desired_capacity,
+                'Recurrence': recurrance
+            }))
+        self._throttled_calls(calls)
 
     @staticmethod
     def _get_snapshot_dev(launch_config, hostclass):
         """Returns the snapshot device config"""
-        snapshot_devs = [
-            device
-            for device in launch_config['BlockDeviceMappings']
-            if device.get('Ebs', {}).get('SnapshotId')
-        ]
-        if not snapshot_devs:
+        snapshot_dev = None
+        for device in launch_config['BlockDeviceMappings']:
+            if device.get('Ebs', {}).get('SnapshotId'):
+                if snapshot_dev is not None:
+                    raise Exception("Unsupported configuration: hostclass {0} has multiple snapshot based "
+                                    "devices.".format(hostclass))
+                snapshot_dev = device
+        if snapshot_dev is None:
             raise Exception("Hostclass {0} does not mount a snapshot".format(hostclass))
-        elif len(snapshot_devs) > 1:
-            raise Exception("Unsupported configuration: hostclass {0} has multiple snapshot based devices."
-                            .format(hostclass))
-        return snapshot_devs[0]
+        return snapshot_dev
 
     def _create_new_launchconfig(self, hostclass, launch_config):
         """Creates a launch configuration"""
         return self._create_launch_config(
-            name='{0}_{1}_{2}'.format(self.environment_name, hostclass, str(random.randrange(0, 9999999))),
+            name=self.get_launch_config_name(hostclass),
             image_id=launch_config.get('ImageId'),
             key_name=launch_config.get('KeyName'),
             security_groups=launch_config.get('SecurityGroups'),
@@ -703,82 +949,149 @@ class DiscoAutoscale(BaseGroup):
             instance_monitoring=launch_config.get('InstanceMonitoring', {}).get('Enabled', False),
             instance_profile_name=launch_config.get('IamInstanceProfile'),
             ebs_optimized=launch_config.get('EbsOptimized'),
-            # decode base64 because boto3 automatically encodes userdata to base64 to avoid encoding it twice
-            user_data=b64decode(launch_config.get('UserData')).decode('utf-8'),
+            user_data=self._get_user_data(launch_config),
             associate_public_ip_address=launch_config.get('AssociatePublicIpAddress')
         )
 
+    def _get_user_data(self, launch_config):
+        """Returns the decoded user data of a launch configuration"""
+        name = launch_config.get('LaunchConfigurationName')
+        user_data = self._user_data.get(name)
+        if user_data is None:
+            # decode base64 because boto3 automatically encodes userdata to base64 to avoid encoding it twice
+            user_data = b64decode(launch_config.get('UserData')).decode('utf-8')
+            if name:
+                self._user_data[name] = user_data
+        return user_data
+
     def update_snapshot(self, snapshot_id, snapshot_size, hostclass=None, group_name=None):
         """Updates all of a hostclasses existing autoscaling groups to use a different snapshot"""
-        launch_config = self._get_launch_config(hostclass=hostclass, group_name=group_name)
+        target = hostclass or group_name
+        cached = self._snapshot_ids.get((hostclass, group_name))
+        if cached and cached[1] == snapshot_id and time.time() - cached[0] < GROUP_CACHE_TTL:
+            logger.debug(
+                "Autoscaling group %s is already referencing latest snapshot %s",
+                target,
+                snapshot_id
+            )
+            return
+
+        launch_config = self._get_launch_config(hostclass=hostclass, group_name=group_name, use_cache=True)
         if not launch_config:
-            raise Exception("Can't locate hostclass {0}".format(hostclass or group_name))
+            raise Exception("Can't locate hostclass {0}".format(target))
         snapshot_bdm = DiscoAutoscale._get_snapshot_dev(launch_config, hostclass)
-        if snapshot_bdm['Ebs']['SnapshotId'] != snapshot_id:
-            old_snapshot_id = snapshot_bdm['Ebs']['SnapshotId']
+        current_snapshot_id = snapshot_bdm['Ebs']['SnapshotId']
+        if current_snapshot_id != snapshot_id:
+            # The launch config is changed below to build the new one, so don't reuse it afterwards
+            self._launch_configs.pop(launch_config['LaunchConfigurationName'], None)
             snapshot_bdm['Ebs']['SnapshotId'] = snapshot_id
             snapshot_bdm['Ebs']['VolumeSize'] = snapshot_size
             self.modify_group(
-                self.get_existing_group(hostclass=hostclass, group_name=group_name),
+                self._cached_get_existing_group(hostclass=hostclass, group_name=group_name),
                 self._create_new_launchconfig(hostclass, launch_config)['LaunchConfigurationName']
             )
             logger.info(
                 "Updating %s group's snapshot from %s to %s",
-                hostclass or group_name,
-                old_snapshot_id,
+                target,
+                current_snapshot_id,
                 snapshot_id
             )
         else:
             logger.debug(
                 "Autoscaling group %s is already referencing latest snapshot %s",
-                hostclass or group_name,
+                target,
                 snapshot_id
             )
+        # Remember the snapshot so asking for it again soon doesn't need to describe the launch config
+        self._snapshot_ids[(hostclass, group_name)] = (time.time(), snapshot_id)
 
-    def update_elb(self, elb_names, hostclass=None, group_name=None):
+    def update_elb(self, elb_names, hostclass=None, group_name=None, group=None):
         """Updates an existing autoscaling group to use a different set of load balancers"""
-        group = self.get_existing_group(hostclass=hostclass, group_name=group_name)
+        lb_changes, _ = self.update_load_targets(elb_names=elb_names, hostclass=hostclass,
+                                                 group_name=group_name, group=group)
+        return lb_changes
 
-        if not group:
-            logger.warning("Auto Scaling group %s does not exist. Cannot change %s ELB(s)",
-                           hostclass or group_name, ', '.join(elb_names))
-            return set(), set()
-
-        new_lbs = set(elb_names) - set(group['load_balancers'])
-        extras = set(group['load_balancers']) - set(elb_names)
-        if new_lbs or extras:
-            logger.info("Updating ELBs for group %s from [%s] to [%s]",
-                        group['name'], ", ".join(group['load_balancers']), ", ".join(elb_names))
-        if new_lbs:
-            throttled_call(self.boto3_autoscale.attach_load_balancers,
-                           AutoScalingGroupName=group['name'],
-                           LoadBalancerNames=list(new_lbs))
-        if extras:
-            throttled_call(self.boto3_autoscale.detach_load_balancers,
-                           AutoScalingGroupName=group['name'],
-                           LoadBalancerNames=list(extras))
-        return new_lbs, extras
-
-    def update_tg(self, target_groups, hostclass=None, group_name=None):
+    def update_tg(self, target_groups, hostclass=None, group_name=None, group=None):
         """Updates an existing autoscaling group to use a different set of target_groups"""
-        group = self.get_existing_group(hostclass=hostclass, group_name=group_name)
+        _, tg_changes = self.update_load_targets(target_groups=target_groups, hostclass=hostclass,
+                                                 group_name=group_name, group=group)
+        return tg_changes
+
+    def update_load_targets(self, elb_names=None, target_groups=None, hostclass=None, group_name=None,
+                            group=None):
+        """
+        Updates an existing autoscaling group to use a different set of load balancers and target groups,
+        looking the group up only once. Passing None for either leaves that set as it is. Callers that
+        already have the group can pass it in to skip the lookup.
+
+        Returns the (added, removed) load balancers and the (added, removed) target groups.
+        """
+        group = group or self._cached_get_existing_group(hostclass=hostclass, group_name=group_name)
         if not group:
-            logger.warning("Auto Scaling group %s does not exist. Cannot change %s Target Groups(s)",
-                           hostclass or group_name, ', '.join(target_groups))
+            target = hostclass or group_name
+            if elb_names is not None:
+                logger.warning("Auto Scaling group %s does not exist. Cannot change %s ELB(s)",
+                               target, ', '.join(elb_names))
+            if target_groups is not None:
+                logger.warning("Auto Scaling group %s does not exist. Cannot change %s Target Groups(s)",
+                               target, ', '.join(target_groups))
+            return (set(), set()), (set(), set())
+
+        calls = []
+        new_lbs, extra_lbs = DiscoAutoscale._diff_load_targets(group['load_balancers'], elb_names)
+        if new_lbs or extra_lbs:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updating ELBs for group %s from [%s] to [%s]",
+                            group['name'], ", ".join(group['load_balancers']), ", ".join(elb_names))
+            if new_lbs:
+                calls.append((self.boto3_autoscale.attach_load_balancers,
+                              {'AutoScalingGroupName': group['name'], 'LoadBalancerNames': list(new_lbs)}))
+            if extra_lbs:
+                calls.append((self.boto3_autoscale.detach_load_balancers,
+                              {'AutoScalingGroupName': group['name'], 'LoadBalancerNames': list(extra_lbs)}))
+
+        new_tgs, extra_tgs = DiscoAutoscale._diff_load_targets(group['target_groups'], target_groups)
+        if new_tgs or extra_tgs:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updating Target Groups for group %s from [%s] to [%s]",
+                            group['name'], ", ".join(group['target_groups']), ", ".join(target_groups))
+            if new_tgs:
+                calls.append((self.boto3_autoscale.attach_load_balancer_target_groups,
+                              {'AutoScalingGroupName': group['name'], 'TargetGroupARNs': list(new_tgs)}))
+            if extra_tgs:
+                calls.append((self.boto3_autoscale.detach_load_balancer_target_groups,
+                              {'AutoScalingGroupName': group['name'], 'TargetGroupARNs': list(extra_tgs)}))
+
+        self._throttled_calls(calls)
+        if new_lbs or extra_lbs:
+            group['load_balancers'] = list(elb_names)
+        if new_tgs or extra_tgs:
+            group['target_groups'] = list(target_groups)
+
+        return (new_lbs, extra_lbs), (new_tgs, extra_tgs)
+
+    @staticmethod
+    def _diff_load_targets(current, wanted):
+        """Returns the targets to add and to remove to get from current to wanted"""
+        if wanted is None:
+            return set(), set()
+        wanted = set(wanted)
+        changed = wanted.symmetric_difference(current)
+        if not changed:
             return set(), set()
-        new_tgs = set(target_groups) - set(group['target_groups'])
-        extras = set(group['target_groups']) - set(target_groups)
-
-        if new_tgs or extras:
-            logger.info("Updating Target Groups for group %s from [%s] to [%s]",
-                        group['name'], ", ".join(group['target_groups']), ", ".join(target_groups))
-        if new_tgs:
-            throttled_call(self.boto3_autoscale.attach_load_balancer_target_groups,
-                           AutoScalingGroupName=group['name'],
-                           TargetGroupARNs=list(new_tgs))
-        if extras:
-            throttled_call(self.boto3_autoscale.detach_load_balancer_target_groups,
-                           AutoScalingGroupName=group['name'],
-                           TargetGroupARNs=list(extras))
-
-        return new_tgs, extras
+        added = changed & wanted
+        return added, changed - added
+
+    def _throttled_calls(self, calls):
+        """Makes the given (function, kwargs) calls concurrently, since they don't depend on each other"""
+        if len(calls) < 2:
+            for func, kwargs in calls:
+                throttled_call(func, **kwargs)
+            return
+
+        pool = ThreadPool(min(len(calls), MAX_CONCURRENT_CALLS))
+        try:
+            pool.map(lambda call: throttled_call(call[0], **call[1]), calls)
+        finally:
+            pool.close()
+            pool.join()
@@ -6,6 +6,7 @@ import csv
 import sys
 from logging import getLogger, DEBUG
 from functools import wraps
+from itertools import izip_longest
 
 import dateutil
 from boto.exception import EC2ResponseError
@@ -79,13 +80,15 @@ def read_pipeline_file(pipeline_file):
     """
     required = ['hostclass']  # fields that must be present in the headers for the file to be valid
     with open(pipeline_file, "r") as f:
-        reader = csv.DictReader(f)
-        logger.debug("pipeline headers: %s", reader.fieldnames)
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        logger.debug("pipeline headers: %s", fieldnames)
         for required_field in required:
-            if required_field not in reader.fieldnames:
+            if required_field not in fieldnames:
                 raise EasyExit("Pipeline file %s is missing required header %s (found: %s)" %
-                               (pipeline_file, required_field, reader.fieldnames))
-        hostclass_dicts = [line for line in reader]
+                               (pipeline_file, required_field, fieldnames))
+        # Skip blank lines, fill in missing trailing fields with None and drop fields without a header
+        hostclass_dicts = [dict(izip_longest(fieldnames, row[:len(fieldnames)])) for row in reader if row]
     return hostclass_dicts
 
 
@@ -55,6 +55,7 @@ class DiscoBake(object):
 
         self._disco_remote_exec = None  # lazily initialized
         self._vpc = None  # lazily initialized
+        self._images = {}  # images already fetched by get_image, keyed by AMI ID
 
         self._use_local_ip = use_local_ip
         self._final_stage = None
@@ -326,14 +327,16 @@ class DiscoBake(object):
 
     def get_image(self, ami_id):
         """
-        Returns an AMI object given an AMI ID.
+        Returns an AMI object given an AMI ID. Images are only fetched from AWS once per DiscoBake.
 
         Raises an AMIError if we can't find the image
         """
-        try:
-            return throttled_call(self.connection.get_image, ami_id)
-        except:
-            raise AMIError("Could not locate image {0}.".format(ami_id))
+        if ami_id not in self._images:
+            try:
+                self._images[ami_id] = throttled_call(self.connection.get_image, ami_id)
+            except:
+                raise AMIError("Could not locate image {0}.".format(ami_id))
+        return self._images[ami_id]
 
     def copy_aws_data(self, instance):
         """
@@ -150,7 +150,7 @@ class DiscoDeploy(object):
 
     def get_items_newer_in_second_map(self, first, second):
         '''Returns AMIs from second dict which are newer than the corresponding item in the first dict'''
-        return [ami for (hostclass, ami) in second.iteritems()
+        return [ami for (hostclass, ami) in second.items()
                 if (first.get(hostclass) is None) or (
                     self._disco_bake.get_ami_creation_time(ami) >
                     self._disco_bake.get_ami_creation_time(first[hostclass]))]
@@ -158,7 +158,7 @@ class DiscoDeploy(object):
     def get_newest_in_either_map(self, first, second):
         '''Returns AMIs which are newest for each hostclass'''
         newest_for_hostclass = first
-        for (hostclass, ami) in second.iteritems():
+        for (hostclass, ami) in second.items():
             if hostclass not in newest_for_hostclass:
                 newest_for_hostclass[hostclass] = ami
             elif (self._disco_bake.get_ami_creation_time(ami) >
@@ -266,7 +266,7 @@ class DiscoDeploy(object):
         launch time will be returned.
         :return: List of instances
         '''
-        hostclass = DiscoBake.ami_hostclass(self._disco_bake.connection.get_image(new_ami_id))
+        hostclass = DiscoBake.ami_hostclass(self._disco_bake.get_image(new_ami_id))
         all_ids = [inst['instance_id'] for inst in self._disco_group.get_instances(hostclass=hostclass)]
         all_instances = self._disco_aws.instances(instance_ids=all_ids)
         return [inst for inst in all_instances
@@ -282,7 +282,7 @@ class DiscoDeploy(object):
         launch time will be returned.
         :return: List of instances
         '''
-        hostclass = DiscoBake.ami_hostclass(self._disco_bake.connection.get_image(new_ami_id))
+        hostclass = DiscoBake.ami_hostclass(self._disco_bake.get_image(new_ami_id))
         all_ids = [inst['instance_id'] for inst in self._disco_group.get_instances(hostclass=hostclass)]
         all_instances = self._disco_aws.instances(filters={"image_id": [new_ami_id]}, instance_ids=all_ids)
         return [inst for inst in all_instances
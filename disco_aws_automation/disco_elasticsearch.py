@@ -22,6 +22,9 @@ from .disco_alarm_config import DiscoAlarmsConfig
 
 logger = logging.getLogger(__name__)
 
+# DescribeElasticsearchDomains accepts at most this many domain names per request
+MAX_DESCRIBE_DOMAINS = 5
+
 
 class DiscoElasticsearch(object):
     """
@@ -160,11 +163,16 @@ class DiscoElasticsearch(object):
             domain_info["route_53_endpoint"] = "{}.{}".format(domain_name, self.zone)
             domain_info["internal_name"] = elasticsearch_name
 
-            if include_endpoint:
-                domain_info["elasticsearch_endpoint"] = self.get_endpoint(domain_name)
-
             domain_infos.append(domain_info)
 
+        if include_endpoint:
+            endpoints = self._get_endpoints(
+                [domain_info["elasticsearch_domain_name"] for domain_info in domain_infos]
+            )
+            for domain_info in domain_infos:
+                domain_name = domain_info["elasticsearch_domain_name"]
+                domain_info["elasticsearch_endpoint"] = endpoints.get(domain_name)
+
         return domain_infos
 
     def _add_route53(self, domain_name):
@@ -202,6 +210,21 @@ class DiscoElasticsearch(object):
         except (BotoCoreError, Boto3Error, KeyError):
             return None
 
+    def _get_endpoints(self, domain_names):
+        """
+        Get the Elasticsearch service endpoints of several domains, describing them in batches
+        rather than one call per domain. Returns a dictionary of domain name to endpoint.
+        """
+        endpoints = {}
+        for index in range(0, len(domain_names), MAX_DESCRIBE_DOMAINS):
+            response = throttled_call(
+                self.conn.describe_elasticsearch_domains,
+                DomainNames=domain_names[index:index + MAX_DESCRIBE_DOMAINS]
+            )
+            for domain_status in response['DomainStatusList']:
+                endpoints[domain_status['DomainName']] = domain_status.get('Endpoint')
+        return endpoints
+
     def get_client_id(self, domain_name):
         """
         Get the client id of the ElasticSearch domain.
@@ -3,6 +3,7 @@
 Manage AWS SSM document creation and execution
 """
 from __future__ import print_function
+from multiprocessing.pool import ThreadPool
 import os
 import logging
 import time
@@ -13,7 +14,7 @@ from botocore.exceptions import ClientError
 from boto.exception import BotoServerError
 
 from .disco_config import read_config
-from .resource_helper import throttled_call, wait_for_state_boto3
+from .resource_helper import throttled_call
 from .exceptions import TimeoutError
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,10 @@ SSM_WAIT_TIMEOUT = 5 * 60
 SSM_WAIT_SLEEP_INTERVAL = 15
 AWS_DOCUMENT_PREFIX = "AWS-"
 SSM_OUTPUT_ERROR_DELIMITER = "----------ERROR-------"
+SSM_COMMAND_MIN_POLL_INTERVAL = 0.25
+SSM_COMMAND_MAX_POLL_INTERVAL = 5
+MAX_CONCURRENT_OUTPUT_FETCHES = 10
+MAX_CONCURRENT_DOC_CHECKS = 10
 
 
 class DiscoSSM(object):
@@ -44,6 +49,8 @@ class DiscoSSM(object):
 
         self._conn = None  # Lazily initialized
         self._s3 = None  # Lazily initialized
+        self._ssm_files = {}  # Standardized document files read during the current update()
+        self._s3_bucket_access = {}  # Whether each S3 bucket could be accessed when first checked
 
     @property
     def conn(self):
@@ -91,11 +98,9 @@ class DiscoSSM(object):
             arguments["Comment"] = comment
 
         if bucket_name is not None:
-            try:
-                # Head bucket checks if a bucket exists and throws an exception if it doesn't
-                self.s3.head_bucket(Bucket=bucket_name)
+            if self._can_access_s3_bucket(bucket_name):
                 arguments["OutputS3BucketName"] = bucket_name
-            except ClientError:
+            else:
                 logger.warning(
                     "Unable to access S3 bucket '%s', output limited to 2500 characters",
                     bucket_name
@@ -126,6 +131,20 @@ class DiscoSSM(object):
             )
             return False
 
+    def _can_access_s3_bucket(self, bucket_name):
+        """
+        Returns whether the given S3 bucket exists and can be accessed. The bucket is only checked the first
+        time, since that doesn't change between executions.
+        """
+        if bucket_name not in self._s3_bucket_access:
+            try:
+                # Head bucket checks if a bucket exists and throws an exception if it doesn't
+                self.s3.head_bucket(Bucket=bucket_name)
+                self._s3_bucket_access[bucket_name] = True
+            except ClientError:
+                self._s3_bucket_access[bucket_name] = False
+        return self._s3_bucket_access[bucket_name]
+
     def _print_ssm_output(self, output):
         """Convenience method for printing output from an SSM command"""
         for instance, instance_output in output.iteritems():
@@ -154,6 +173,8 @@ class DiscoSSM(object):
         equals the desired status, or False otherwise. For example, the command could be cancelled before it
         completes, or it could return a non-zero exit code.
         """
+        # Poll quickly at first so short commands return quickly, then back off for long running ones
+        poll_interval = SSM_COMMAND_MIN_POLL_INTERVAL
         while True:
             command = self._list_commands(
                 CommandId=command_id
@@ -167,7 +188,8 @@ class DiscoSSM(object):
                     "Could not find command id '%s', waiting a few seconds before looking again",
                     command_id
                 )
-                time.sleep(5)
+                time.sleep(SSM_COMMAND_MAX_POLL_INTERVAL)
+                poll_interval = SSM_COMMAND_MIN_POLL_INTERVAL
                 # Right now this is an infinite loop, but we'd never call this without a real command_id as
                 # its an internal function for DiscoSSM. If this loops forever with a proper command_id, that
                 # probably means AWS is having a bad day, and we've got bigger worries than a hanging command.
@@ -190,7 +212,8 @@ class DiscoSSM(object):
                 document_name,
                 instance_ids
             )
-            time.sleep(5)
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, SSM_COMMAND_MAX_POLL_INTERVAL)
 
     def get_ssm_command_output(self, command_id):
         """
@@ -217,24 +240,43 @@ class DiscoSSM(object):
             Details=True
         )
 
-        response = {}
+        plugins = [
+            (command_invocation['InstanceId'], command_plugin)
+            for command_invocation in command_invocations["CommandInvocations"]
+            for command_plugin in command_invocation['CommandPlugins']
+        ]
 
-        for command_invocation in command_invocations["CommandInvocations"]:
-            instance_id = command_invocation['InstanceId']
-            instance_output = []
+        if not plugins:
+            return {command_invocation['InstanceId']: []
+                    for command_invocation in command_invocations["CommandInvocations"]}
 
-            for command_plugin in command_invocation['CommandPlugins']:
-                if command_plugin.get('OutputS3BucketName'):
-                    plugin_output = self._get_output_from_s3(command_plugin)
-                else:
-                    plugin_output = self._get_output_from_ssm(command_plugin)
+        if any(command_plugin.get('OutputS3BucketName') for _, command_plugin in plugins):
+            # boto3 clients can be shared between threads, but shouldn't be created by several at once.
+            # Accessing the lazily initialized s3 property creates the client before the threads start.
+            self.s3  # pylint: disable=pointless-statement
 
-                instance_output.append(plugin_output)
+        # Every plugin's output is fetched separately, so fetch them at the same time
+        pool = ThreadPool(min(len(plugins), MAX_CONCURRENT_OUTPUT_FETCHES))
+        try:
+            plugin_outputs = pool.map(self._get_plugin_output,
+                                      [command_plugin for _, command_plugin in plugins])
+        finally:
+            pool.close()
+            pool.join()
 
-            response[instance_id] = instance_output
+        response = {command_invocation['InstanceId']: []
+                    for command_invocation in command_invocations["CommandInvocations"]}
+        for (instance_id, _), plugin_output in zip(plugins, plugin_outputs):
+            response[instance_id].append(plugin_output)
 
         return response
 
+    def _get_plugin_output(self, command_plugin):
+        """Helper method for extracting the output of a command plugin from wherever it was stored"""
+        if command_plugin.get('OutputS3BucketName'):
+            return self._get_output_from_s3(command_plugin)
+        return self._get_output_from_ssm(command_plugin)
+
     def _get_output_from_ssm(self, command_plugin):
         """Helper method for extracting command output directly from SSM"""
         output = command_plugin['Output'].split(SSM_OUTPUT_ERROR_DELIMITER)
@@ -329,6 +371,8 @@ class DiscoSSM(object):
 
     def update(self, wait=True, dry_run=False):
         """ Updates SSM documents from configuration """
+        # Re-read the configured documents on every update, but only once each
+        self._ssm_files = {}
         desired_docs = set(self._list_docs_in_config())
         existing_docs = set([doc["Name"] for doc in self.get_all_documents()])
 
@@ -370,10 +414,22 @@ class DiscoSSM(object):
         Returns the documents whose content in the configuration is different from
         the one currently in AWS
         """
+        doc_names = list(docs_to_check)
+        if not doc_names:
+            return set()
+
+        # Each document's content is fetched separately, so fetch them at the same time
+        pool = ThreadPool(min(len(doc_names), MAX_CONCURRENT_DOC_CHECKS))
+        try:
+            existing_contents = pool.map(self.get_document_content, doc_names)
+        finally:
+            pool.close()
+            pool.join()
+
         docs_to_update = set()
-        for doc_name in docs_to_check:
+        for doc_name, existing_content in zip(doc_names, existing_contents):
             desired_json = self._read_ssm_file(doc_name)
-            existing_json = self._standardize_json_str(self.get_document_content(doc_name))
+            existing_json = self._standardize_json_str(existing_content)
 
             if desired_json != existing_json:
                 docs_to_update.add(doc_name)
@@ -381,44 +437,71 @@ class DiscoSSM(object):
         return docs_to_update
 
     def _wait_for_docs_deleted(self, docs_to_delete):
-        for doc_name in docs_to_delete:
-            time_passed = 0
+        self._wait_for_docs(docs_to_delete, self._is_doc_deleted, "deleted")
 
+    def _wait_for_docs_active(self, docs_to_wait):
+        self._wait_for_docs(docs_to_wait, self._is_doc_active, "active")
+
+    def _wait_for_docs(self, doc_names, is_done, state_name):
+        """
+        Waits until is_done returns True for every one of the given documents, checking on all of the
+        documents that are still pending every SSM_WAIT_SLEEP_INTERVAL seconds
+        """
+        pending_docs = list(doc_names)
+        if not pending_docs:
+            return
+
+        time_passed = 0
+        # Documents change state independently of each other, so check on them at the same time
+        pool = ThreadPool(min(len(pending_docs), MAX_CONCURRENT_DOC_CHECKS))
+        try:
             while True:
-                try:
-                    self.conn.describe_document(Name=doc_name)
-                except ClientError:
-                    # When the document is deleted, calling the describe method would
-                    # result in a ClientError being thrown, that's when we know the document
-                    # has been deleted.
-                    break
+                done = pool.map(is_done, pending_docs)
+                pending_docs = [doc_name for doc_name, is_doc_done in zip(pending_docs, done)
+                                if not is_doc_done]
+                if not pending_docs:
+                    return
 
                 if time_passed >= SSM_WAIT_TIMEOUT:
                     raise TimeoutError(
-                        "Timed out waiting for document ({0}) to be deleted after {1}s"
-                        .format(doc_name, time_passed))
+                        "Timed out waiting for documents ({0}) to be {1} after {2}s"
+                        .format(", ".join(pending_docs), state_name, time_passed))
 
                 time.sleep(SSM_WAIT_SLEEP_INTERVAL)
                 time_passed += SSM_WAIT_SLEEP_INTERVAL
+        finally:
+            pool.close()
+            pool.join()
 
-    def _wait_for_docs_active(self, docs_to_wait):
-        for doc_name in docs_to_wait:
-            wait_for_state_boto3(describe_func=self.conn.describe_document,
-                                 params_dict={"Name": doc_name},
-                                 resources_name="Document",
-                                 expected_state="Active",
-                                 state_attr="Status",
-                                 timeout=SSM_WAIT_TIMEOUT)
+    def _is_doc_deleted(self, doc_name):
+        try:
+            self.conn.describe_document(Name=doc_name)
+        except ClientError:
+            # When the document is deleted, calling the describe method would
+            # result in a ClientError being thrown, that's when we know the document
+            # has been deleted.
+            return True
+        return False
+
+    def _is_doc_active(self, doc_name):
+        try:
+            return self.conn.describe_document(Name=doc_name)["Document"]["Status"] == "Active"
+        except ClientError:
+            # Most likely transient, we will time out if it is not
+            return False
 
     def _read_ssm_file(self, doc_name):
-        file_path = "{0}/{1}{2}".format(SSM_DOCUMENTS_DIR, doc_name, SSM_EXT)
-        with open(file_path, 'r') as infile:
-            ssm_content = infile.read()
+        if doc_name not in self._ssm_files:
+            file_path = "{0}/{1}{2}".format(SSM_DOCUMENTS_DIR, doc_name, SSM_EXT)
+            with open(file_path, 'r') as infile:
+                ssm_content = infile.read()
 
-        try:
-            return self._standardize_json_str(ssm_content)
-        except ValueError:
-            raise RuntimeError("Invalid SSM document file: {0}".format(file_path))
+            try:
+                self._ssm_files[doc_name] = self._standardize_json_str(ssm_content)
+            except ValueError:
+                raise RuntimeError("Invalid SSM document file: {0}".format(file_path))
+
+        return self._ssm_files[doc_name]
 
     def _standardize_json_str(self, json_str):
         return json.dumps(json.loads(json_str), indent=4)
@@ -0,0 +1,236 @@
+"""
+Command line tool for creating and destroying VPC's
+"""
+
+from __future__ import print_function
+import argparse
+import sys
+
+from . import DiscoVPC, DiscoVPCPeerings
+from .disco_aws_util import graceful
+from .disco_logging import configure_logging
+from .resource_helper import key_values_to_tags, tag2dict
+
+
+def _add_create_parser(subparsers):
+    """Adds the parser for the create sub-command"""
+    parser_create = subparsers.add_parser('create', help='Create new VPC based environmnet')
+    parser_create.set_defaults(mode="create")
+    parser_create.add_argument('--name', dest='vpc_name', required=True,
+                               help='What to call the new environment.')
+    parser_create.add_argument('--type', dest='vpc_type', required=True,
+                               help='What type of environment to create (as defined in config).')
+    parser_create.add_argument('--skip-enis', dest='skip_enis', action='store_true',
+                               help="Skip pre-allocating ENIs with static IPs used by hostclasses.")
+    parser_create.add_argument('--tag', dest='tags', required=False, action='append', type=str,
+                               help="The key:value pair used to tag the VPC"
+                                    " (Example: --tag productline:astronauts).")
+
+
+def _add_destroy_parser(subparsers):
+    """Adds the parser for the destroy sub-command"""
+    parser_destroy = subparsers.add_parser(
+        'destroy', help='Delete environment releasing all non-persistent resources.')
+    parser_destroy.set_defaults(mode='destroy')
+    parser_destroy_group = parser_destroy.add_mutually_exclusive_group(required=True)
+    parser_destroy_group.add_argument('--name', dest='vpc_name', default=None,
+                                      help="The name of the environment that ought to be destroyed.")
+    parser_destroy_group.add_argument('--vpc-id', dest='vpc_id', default=None,
+                                      help="The VPC ID of the environment that ought to be destroyed.")
+
+
+def _add_list_parser(subparsers):
+    """Adds the parser for the list sub-command"""
+    parser_list = subparsers.add_parser('list', help='List all current VPCs')
+    parser_list.set_defaults(mode="list")
+    parser_list.add_argument('--type', dest='env_type', action='store_true', help='Print env type')
+
+
+def _add_peerings_parser(subparsers):
+    """Adds the parser for the peerings sub-command"""
+    parser_peerings = subparsers.add_parser('peerings', help='operation on vpc peerings')
+    parser_peerings.set_defaults(mode="peerings")
+    parser_peerings_action = parser_peerings.add_mutually_exclusive_group(required=True)
+    parser_peerings_action.add_argument(
+        '--create', dest='create_peerings', action='store_true',
+        help='Create peerings between the VPCs that currently exist, as configured in disco_vpc.ini')
+    parser_peerings_action.add_argument('--delete', dest='delete_peerings', action='store_true',
+                                        help='Delete all existing VPC peerings')
+    parser_peerings_action.add_argument('--list', dest='list_peerings', action='store_true',
+                                        help='List all VPC peerings')
+    parser_peerings_group = parser_peerings.add_mutually_exclusive_group(required=False)
+    parser_peerings_group.add_argument('--name', dest='vpc_name', required=False, default=None,
+                                       help='The VPC Name of the environment for VPC peering operation')
+    parser_peerings_group.add_argument('--vpc-id', dest='vpc_id', required=False, default=None,
+                                       help="The VPC ID of the environment for VPC peering operation")
+
+
+def _add_update_parser(subparsers):
+    """Adds the parser for the update sub-command"""
+    parser_update = subparsers.add_parser(
+        'update', help='Update environment settings.')
+    parser_update.set_defaults(mode='update')
+    parser_update_group = parser_update.add_mutually_exclusive_group(required=True)
+    parser_update_group.add_argument('--name', dest='vpc_name', default=None,
+                                     help="The name of the environment that ought to be updated.")
+    parser_update_group.add_argument('--vpc-id', dest='vpc_id', default=None,
+                                     help="The VPC ID of the environment that ought to be updated.")
+    parser_update.add_argument('--dry-run', dest='dry_run', action='store_true',
+                               help="Whether to test run the update before the actual run. No "
+                               "changes would be made to the VPC if this is set to True.")
+
+
+# Sub-command names and the functions that add their parsers, in the order they are listed in --help
+SUBPARSER_BUILDERS = [
+    ('create', _add_create_parser),
+    ('destroy', _add_destroy_parser),
+    ('list', _add_list_parser),
+    ('peerings', _add_peerings_parser),
+    ('update', _add_update_parser),
+]
+
+
+def parse_arguments():
+    """Read in options passed in over command line"""
+    parser = argparse.ArgumentParser(description='AWS VPC automation')
+    parser.add_argument('--debug', dest='debug', action='store_true', help='Log in debug level.')
+    subparsers = parser.add_subparsers(help='Sub-command help')
+
+    # Only --debug can come before the sub-command, so the first positional argument names it.
+    # Build just that sub-command's parser, or all of them for help and usage errors.
+    mode = next((arg for arg in sys.argv[1:] if not arg.startswith('-')), None)
+    builders = [builder for name, builder in SUBPARSER_BUILDERS if name == mode]
+    for builder in builders or [builder for _, builder in SUBPARSER_BUILDERS]:
+        builder(subparsers)
+
+    return parser.parse_args()
+
+
+def create_vpc_command(args):
+    """ handle vpc create command actions"""
+    if DiscoVPC.fetch_environment(environment_name=args.vpc_name):
+        print("VPC with same name already exists.")
+        sys.exit(1)
+    else:
+        tags = tag2dict(key_values_to_tags(args.tags)) if args.tags else None
+        vpc = DiscoVPC(args.vpc_name, args.vpc_type, skip_enis_pre_allocate=args.skip_enis,
+                       vpc_tags=tags)
+        print("VPC {0}({1}) has been created".format(args.vpc_name, vpc.get_vpc_id()))
+
+
+def destroy_vpc_command(args):
+    """ handle vpc destroy command actions"""
+    if args.vpc_name:
+        vpc = DiscoVPC.fetch_environment(environment_name=args.vpc_name)
+    else:
+        vpc = DiscoVPC.fetch_environment(vpc_id=args.vpc_id)
+
+    if vpc:
+        vpc.destroy()
+    else:
+        print("No matching VPC found")
+        sys.exit(2)
+
+
+def update_vpc_command(args):
+    """ handle vpc update command actions"""
+    if args.vpc_name:
+        vpc = DiscoVPC.fetch_environment(environment_name=args.vpc_name)
+    else:
+        vpc = DiscoVPC.fetch_environment(vpc_id=args.vpc_id)
+
+    if vpc:
+        vpc.update(args.dry_run)
+    else:
+        print("No matching VPC found")
+        sys.exit(2)
+
+
+def list_vpc_command(args):
+    """ handle list vpcs command actions """
+    vpcs = DiscoVPC.list_vpcs()
+    if args.env_type:
+        format_line = u"{0}\t{1:<15}\t{2}".format
+        lines = [format_line(vpc['id'], vpc['tags'].get("Name", "-"), vpc['tags'].get("type", "-"))
+                 for vpc in vpcs]
+    else:
+        format_line = u"{0}\t{1:<15}".format
+        lines = [format_line(vpc['id'], vpc['tags'].get("Name", "-")) for vpc in vpcs]
+    if lines:
+        sys.stdout.write(u"\n".join(lines) + u"\n")
+
+
+def proxy_peerings_command(args):
+    """ handle peerings command actions"""
+    disco_peerings = DiscoVPCPeerings()
+
+    if args.list_peerings:
+        # Listing shows the name of every VPC, so look up the requested VPC in that same
+        # DescribeVpcs result instead of describing it separately
+        vpcs = DiscoVPC.list_vpcs() if args.vpc_name or args.vpc_id else None
+        vpc_id = None
+        if args.vpc_name:
+            vpc_id = next((vpc['id'] for vpc in vpcs if vpc['tags'].get("Name") == args.vpc_name), None)
+        elif args.vpc_id in [vpc['id'] for vpc in vpcs or []]:
+            vpc_id = args.vpc_id
+
+        peerings = disco_peerings.list_peerings(vpc_id, include_failed=True)
+        if not peerings:
+            return
+
+        # Without a VPC to look for, the VPCs are only described once there are peerings to name
+        vpc_map = {vpc['id']: vpc for vpc in (DiscoVPC.list_vpcs() if vpcs is None else vpcs)}
+        peerings = sorted(
+            peerings,
+            # Peerings with a VPC that isn't listed (e.g. in another account) sort as having no name
+            key=lambda p: (vpc_map.get(p['AccepterVpcInfo']['VpcId']) or {}).get('tags', {}).get("Name", ""))
+
+        format_line = u"{0:<14} {1:<8} {2:<20} {3:<21}".format
+        lines = []
+        for peering in peerings:
+            accepter = peering['AccepterVpcInfo']
+            requester = peering['RequesterVpcInfo']
+            vpc1 = vpc_map.get(accepter['VpcId'])
+            vpc2 = vpc_map.get(requester['VpcId'])
+
+            lines.append(format_line(
+                peering['VpcPeeringConnectionId'],
+                peering['Status']['Code'],
+                u"{}<->{}".format(
+                    vpc1['tags'].get("Name") if vpc1 is not None else "",
+                    vpc2['tags'].get("Name") if vpc2 is not None else ""),
+                u"{}<->{}".format(accepter.get('CidrBlock'), requester.get('CidrBlock'))))
+        if lines:
+            sys.stdout.write(u"\n".join(lines) + u"\n")
+        return
+
+    vpc = None
+    if args.vpc_name:
+        vpc = DiscoVPC.fetch_environment(environment_name=args.vpc_name)
+    elif args.vpc_id:
+        vpc = DiscoVPC.fetch_environment(vpc_id=args.vpc_id)
+
+    if args.delete_peerings:
+        disco_peerings.delete_peerings(vpc.get_vpc_id() if vpc else None)
+    elif args.create_peerings:
+        disco_peerings.update_peering_connections(vpc)
+
+
+# Handler for each sub-command, keyed by the mode its parser sets
+COMMANDS = {
+    'create': create_vpc_command,
+    'destroy': destroy_vpc_command,
+    'list': list_vpc_command,
+    'peerings': proxy_peerings_command,
+    'update': update_vpc_command,
+}
+
+
+@graceful
+def run():
+    """Parses command line and dispatches the commands"""
+    args = parse_arguments()
+    configure_logging(args.debug)
+
+    COMMANDS[args.mode](args)
+
@@ -19,6 +19,14 @@ logger = logging.getLogger(__name__)
 STATE_POLL_INTERVAL = 2  # seconds
 INSTANCE_SSHABLE_POLL_INTERVAL = 15  # seconds
 MAX_POLL_INTERVAL = 60  # seconds
+# Error codes AWS APIs use when a call was rejected for exceeding a rate limit
+THROTTLED_ERROR_CODES = (
+    "Throttling",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "TooManyRequestsException"
+)
 
 
 def create_filters(filter_dict):
@@ -113,7 +121,7 @@ def throttled_call(fun, *args, **kwargs):
             else:
                 error_code = err.response['Error'].get('Code', 'Unknown')
 
-            if (error_code not in ("Throttling", "RequestLimitExceeded")) or time_passed > max_time:
+            if (error_code not in THROTTLED_ERROR_CODES) or time_passed > max_time:
                 raise
 
             time_passed = jitter.backoff()
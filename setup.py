@@ -98,7 +98,8 @@ setup(name='asiaq',
     entry_points={
         'console_scripts': [
             'asiaq_sandbox = %s.asiaq_cli:sandbox_command' % MODULE_NAME,
-            'asiaq = %s.asiaq_cli:super_command' % MODULE_NAME
+            'asiaq = %s.asiaq_cli:super_command' % MODULE_NAME,
+            'disco_vpc = %s.disco_vpc_ui:run' % MODULE_NAME
         ]
     },
 )
@@ -116,7 +116,59 @@ class DiscoAutoscaleTests(TestCase):
                 Cooldown=600,
                 MinAdjustmentMagnitude=1
             )
-        ])
+        ], any_order=True)
+
+    def test_get_group_keeps_current_policies(self):
+        """Test getting an existing group leaves scaling policies that are already up to date alone"""
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [self.mock_group_dictionary("mhcdummy")]
+        }
+        self._mock_boto3_connection.describe_policies.return_value = {
+            'ScalingPolicies': [
+                {
+                    'PolicyName': name,
+                    'PolicyType': 'SimpleScaling',
+                    'AdjustmentType': 'PercentChangeInCapacity',
+                    'ScalingAdjustment': adjustment,
+                    'MinAdjustmentMagnitude': 1,
+                    'Cooldown': 600
+                }
+                for name, adjustment in [('up', 10), ('down', -5)]
+            ]
+        }
+
+        group = self._autoscale.get_group(
+            hostclass="mhcdummy",
+            launch_config="launch_config-X",
+            vpc_zone_id="zone-X",
+        )
+
+        self._mock_boto3_connection.put_scaling_policy.assert_called_once_with(
+            AutoScalingGroupName=group['name'],
+            PolicyName='down',
+            PolicyType='SimpleScaling',
+            AdjustmentType='PercentChangeInCapacity',
+            ScalingAdjustment=-10,
+            Cooldown=600,
+            MinAdjustmentMagnitude=1
+        )
+
+    def test_get_group_leaves_unchanged_group_alone(self):
+        """Test getting an existing group does not update it when nothing changed"""
+        mock_group = self.mock_group_dictionary("mhcdummy")
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [mock_group]
+        }
+
+        self._autoscale.get_group(
+            hostclass="mhcdummy",
+            launch_config=mock_group['LaunchConfigurationName'],
+            min_size=1, max_size=1, desired_size=1,
+            tags={'Fake': 'Fake'}
+        )
+
+        self._mock_boto3_connection.update_auto_scaling_group.assert_not_called()
+        self._mock_boto3_connection.create_or_update_tags.assert_not_called()
 
     def test_get_group_attach_elb(self):
         """Test getting a group and attaching an elb"""
@@ -261,7 +313,7 @@ class DiscoAutoscaleTests(TestCase):
         policy_types = ["mock_policy_type"]
         policy_names = ["mock_policy_name"]
         next_token = "mock_token"
-        mock_policies = [{'AutoScalingGroupName': self.environment_name + 'ASG_name_1',
+        mock_policies = [{'AutoScalingGroupName': self.environment_name + '_ASG_name_1',
                           'PolicyName': 'policy_name_1',
                           'PolicyType': 'policy_type_1',
                           'AdjustmentType': 'adjustment_type_1',
@@ -271,7 +323,7 @@ class DiscoAutoscaleTests(TestCase):
                           'Cooldown': 200,
                           'EstimatedInstanceWarmup': 333,
                           'Alarms': ['mock_alarm_1']},
-                         {'AutoScalingGroupName': self.environment_name + 'ASG_name_2',
+                         {'AutoScalingGroupName': self.environment_name + '_ASG_name_2',
                           'PolicyName': 'policy_name_2',
                           'PolicyType': 'policy_type_2',
                           'AdjustmentType': 'adjustment_type_2',
@@ -376,6 +428,25 @@ class DiscoAutoscaleTests(TestCase):
         mock_lc = self.mock_launchconfig(self._autoscale.environment_name, "mhcfoo")
         self.assertEqual(DiscoAutoscale._get_snapshot_dev(mock_lc, "mhcfoo")['DeviceName'], "/dev/snap")
 
+    def test_get_launch_config_is_not_cached(self):
+        """get_launch_config looks the group and its launch config up again on every call"""
+        mock_lc = self.mock_launchconfig(self._autoscale.environment_name, "mhcfoo")
+        mock_lc['InstanceType'] = 'm3.large'
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [
+                self.mock_group_dictionary("mhcfoo", launch_config_name=mock_lc['LaunchConfigurationName'])
+            ]
+        }
+        self._mock_boto3_connection.describe_launch_configurations.return_value = {
+            'LaunchConfigurations': [mock_lc]
+        }
+
+        self._autoscale.get_launch_config(hostclass="mhcfoo")
+        self.assertEqual({'instance_type': 'm3.large'}, self._autoscale.get_launch_config(hostclass="mhcfoo"))
+
+        self.assertEqual(2, self._mock_boto3_connection.describe_auto_scaling_groups.call_count)
+        self.assertEqual(2, self._mock_boto3_connection.describe_launch_configurations.call_count)
+
     def test_update_snapshot_using_latest(self):
         """Calling update_snapshot when already running latest snapshot does nothing"""
         self._autoscale._get_launch_config = MagicMock(
@@ -384,6 +455,28 @@ class DiscoAutoscaleTests(TestCase):
         self._autoscale.update_snapshot("snap-12345678", 99, hostclass="mhcfoo")
         self.assertEqual(self._autoscale.modify_group.call_count, 0)
 
+    def test_update_snapshot_remembers_latest(self):
+        """Calling update_snapshot again with the same snapshot doesn't look up the launch config"""
+        self._autoscale._get_launch_config = MagicMock(
+            return_value=self.mock_launchconfig(self._autoscale.environment_name, "mhcfoo"))
+        self._autoscale.modify_group = MagicMock()
+        self._autoscale.update_snapshot("snap-12345678", 99, hostclass="mhcfoo")
+        self._autoscale.update_snapshot("snap-12345678", 99, hostclass="mhcfoo")
+        self.assertEqual(self._autoscale._get_launch_config.call_count, 1)
+        self.assertEqual(self._autoscale.modify_group.call_count, 0)
+
+    def test_invalidate_group_cache_for_one_group(self):
+        """invalidate_group_cache with a group name keeps the lookups of other hostclasses"""
+        self._autoscale._group_cache[("mhcfoo", None)] = (0, ["foo"])
+        self._autoscale._group_cache[("mhcbar", None)] = (0, ["bar"])
+        self._autoscale._snapshot_ids[("mhcfoo", None)] = (0, "snap-foo")
+        self._autoscale._snapshot_ids[("mhcbar", None)] = (0, "snap-bar")
+
+        self._autoscale.invalidate_group_cache(group_name="us-moon-1_mhcfoo_1")
+
+        self.assertEqual([("mhcbar", None)], list(self._autoscale._group_cache))
+        self.assertEqual([("mhcbar", None)], list(self._autoscale._snapshot_ids))
+
     def test_update_snapshot_with_update(self):
         """Calling update_snapshot when not running latest snapshot calls modify_group with new config"""
         mock_lc = self.mock_launchconfig(self._autoscale.environment_name, "mhcfoo", 1)
@@ -413,6 +506,9 @@ class DiscoAutoscaleTests(TestCase):
 
             ret = self._autoscale.update_elb(["new_lb"], hostclass="mhcfoo")
             self.assertEqual(ret, (set(["new_lb"]), set(["old_lb1", "old_lb2"])))
+            self._mock_boto3_connection.attach_load_balancers.assert_called_once_with(
+                AutoScalingGroupName=grp['AutoScalingGroupName'], LoadBalancerNames=["new_lb"])
+            self.assertEqual(1, self._mock_boto3_connection.detach_load_balancers.call_count)
 
     def test_update_elb_with_new_lb_and_old_lb(self):
         """update_elb will not churn an lb that is in both the existing config and new config"""
@@ -434,6 +530,19 @@ class DiscoAutoscaleTests(TestCase):
             ret = self._autoscale.update_elb([], hostclass="mhcfoo")
             self.assertEqual(ret, (set([]), set(["old_lb1", "old_lb2"])))
 
+    def test_update_elb_reuses_group(self):
+        """update_elb and update_tg describe a group only once in quick succession"""
+        grp = self.mock_group_dictionary("mhcfoo")
+        grp['LoadBalancerNames'] = ["old_lb"]
+        get_groups = MagicMock(return_value=[grp])
+        with patch("disco_aws_automation.disco_autoscale.get_boto3_paged_results", get_groups):
+            self._autoscale.update_elb(["new_lb"], hostclass="mhcfoo")
+            self._autoscale.update_tg(["new_tg"], hostclass="mhcfoo")
+            ret = self._autoscale.update_elb(["new_lb"], hostclass="mhcfoo")
+
+        self.assertEqual(ret, (set([]), set([])))
+        self.assertEqual(1, get_groups.call_count)
+
     def test_update_tg_with_new_lb(self):
         """update_tg will add new tg and remove old when there is no overlap in sets"""
         grp = self.mock_group_dictionary("mhcfoo")
@@ -464,6 +573,23 @@ class DiscoAutoscaleTests(TestCase):
             ret = self._autoscale.update_tg([], hostclass="mhcfoo")
             self.assertEqual(ret, (set([]), set(["old_tg1", "old_tg2"])))
 
+    def test_update_load_targets(self):
+        """update_load_targets updates load balancers and target groups with one group lookup"""
+        grp = self.mock_group_dictionary("mhcfoo")
+        grp['LoadBalancerNames'] = ["old_lb"]
+        grp['TargetGroupARNs'] = ["both_tg"]
+        get_groups = MagicMock(return_value=[grp])
+        with patch("disco_aws_automation.disco_autoscale.get_boto3_paged_results", get_groups):
+            ret = self._autoscale.update_load_targets(elb_names=["new_lb"],
+                                                      target_groups=["both_tg", "new_tg"],
+                                                      hostclass="mhcfoo")
+
+        self.assertEqual(ret, ((set(["new_lb"]), set(["old_lb"])), (set(["new_tg"]), set([]))))
+        self.assertEqual(1, get_groups.call_count)
+        self._mock_boto3_connection.attach_load_balancer_target_groups.assert_called_once_with(
+            AutoScalingGroupName=grp['AutoScalingGroupName'], TargetGroupARNs=["new_tg"])
+        self._mock_boto3_connection.detach_load_balancer_target_groups.assert_not_called()
+
     def test_gg_filters_env_correctly(self):
         """group_generator correctly filters based on the environment"""
         good_groups = [
@@ -500,6 +626,48 @@ class DiscoAutoscaleTests(TestCase):
 
             self.assertEqual(sorted(good_group_ids), sorted(actual_group_ids))
 
+    def test_gg_finds_untagged_groups(self):
+        """get_existing_groups finds groups by their name, whether or not they are tagged"""
+        needle_group = self.mock_group_dictionary("mhcneedle")
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [needle_group, self.mock_group_dictionary("mhcfoo")]
+        }
+
+        actual_groups = self._autoscale.get_existing_groups(hostclass="mhcneedle")
+
+        self.assertEqual([needle_group['AutoScalingGroupName']], [group['name'] for group in actual_groups])
+        self._mock_boto3_connection.describe_auto_scaling_groups.assert_called_once_with(MaxRecords=100)
+
+    def test_gg_looks_up_group_by_name(self):
+        """get_existing_groups asks AWS only for the named group when given a group name"""
+        needle_group = self.mock_group_dictionary("mhcneedle")
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [needle_group]
+        }
+
+        self._autoscale.get_existing_groups(group_name=needle_group['AutoScalingGroupName'])
+
+        self._mock_boto3_connection.describe_auto_scaling_groups.assert_called_once_with(
+            AutoScalingGroupNames=[needle_group['AutoScalingGroupName']],
+            MaxRecords=100
+        )
+
+    def test_gg_only_converts_tags_when_asked(self):
+        """get_existing_groups only includes group tags when include_tags is set"""
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [self.mock_group_dictionary("mhcfoo")]
+        }
+
+        self.assertNotIn('tags', self._autoscale.get_existing_groups()[0])
+        self.assertEqual({"Fake": "Fake"}, self._autoscale.get_existing_groups(include_tags=True)[0]['tags'])
+
+    def test_get_hostclass(self):
+        """_get_hostclass returns everything between the environment and the group id"""
+        self.assertEqual("mhcfoo", self._autoscale._get_hostclass("us-moon-1_mhcfoo_123"))
+        self.assertEqual("mhc_foo_bar", self._autoscale._get_hostclass("us-moon-1_mhc_foo_bar_123"))
+        self.assertEqual("", self._autoscale._get_hostclass("us-moon-1_123"))
+        self.assertEqual("", self._autoscale._get_hostclass("us-moon-1"))
+
     def test_ig_filters_env_correctly(self):
         """inst_generator correctly filters based on the environment"""
         good_insts = [self.mock_inst("mhcfoo"), self.mock_inst("mhcbar"), self.mock_inst("mhcfoobar")]
@@ -554,6 +722,109 @@ class DiscoAutoscaleTests(TestCase):
 
         self.assertEqual(self._autoscale.get_configs(), good_lgs)
 
+    def test_list_groups_describes_configs_once(self):
+        """list_groups looks up the image of every group with a single launch config listing"""
+        foo_lg = self.mock_lg("mhcfoo")
+        foo_lg['ImageId'] = 'ami-foo'
+        bar_lg = self.mock_lg("mhcbar")
+        bar_lg['ImageId'] = 'ami-bar'
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [
+                self.mock_group_dictionary("mhcfoo", launch_config_name=foo_lg['LaunchConfigurationName']),
+                self.mock_group_dictionary("mhcbar", launch_config_name=bar_lg['LaunchConfigurationName']),
+                self.mock_group_dictionary("mhcbaz", launch_config_name="")
+            ]
+        }
+        self._mock_boto3_connection.describe_launch_configurations.return_value = {
+            'LaunchConfigurations': [foo_lg, bar_lg]
+        }
+        self._mock_boto3_connection.describe_auto_scaling_instances.return_value = {
+            'AutoScalingInstances': []
+        }
+
+        groups = self._autoscale.list_groups()
+
+        self.assertEqual(['ami-foo', '', 'ami-bar'], [group['image_id'] for group in groups])
+        self.assertEqual(1, self._mock_boto3_connection.describe_launch_configurations.call_count)
+
+    def test_list_groups_batches_config_names(self):
+        """list_groups describes launch configs by name, at most 50 names per call"""
+        groups = [self.mock_group_dictionary("mhcfoo{0}".format(index)) for index in range(51)]
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': groups
+        }
+        self._mock_boto3_connection.describe_launch_configurations.return_value = {
+            'LaunchConfigurations': []
+        }
+        self._mock_boto3_connection.describe_auto_scaling_instances.return_value = {
+            'AutoScalingInstances': []
+        }
+
+        self._autoscale.list_groups()
+
+        calls = self._mock_boto3_connection.describe_launch_configurations.call_args_list
+        self.assertEqual([50, 1], [len(kwargs['LaunchConfigurationNames']) for _, kwargs in calls])
+
+    def test_list_groups_counts_instances(self):
+        """list_groups counts the instances belonging to each group"""
+        foo_group = self.mock_group_dictionary("mhcfoo")
+        bar_group = self.mock_group_dictionary("mhcbar")
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [foo_group, bar_group]
+        }
+        self._mock_boto3_connection.describe_launch_configurations.return_value = {
+            'LaunchConfigurations': []
+        }
+        self._mock_boto3_connection.describe_auto_scaling_instances.return_value = {
+            'AutoScalingInstances': [
+                self.mock_inst("mhcfoo", group_name=foo_group['AutoScalingGroupName']),
+                self.mock_inst("mhcfoo", group_name=foo_group['AutoScalingGroupName'])
+            ]
+        }
+
+        groups = self._autoscale.list_groups()
+
+        self.assertEqual([2, 0], [group['group_cnt'] for group in groups])
+
+    def test_delete_all_recurring_group_actions(self):
+        """delete_all_recurring_group_actions deletes only recurring actions of every matching group"""
+        foo_group = self.mock_group_dictionary("mhcfoo")
+        bar_group = self.mock_group_dictionary("mhcbar")
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [foo_group, bar_group]
+        }
+        actions = {
+            foo_group['AutoScalingGroupName']: [
+                {'ScheduledActionName': 'foo_daily', 'Recurrence': '0 0 * * *'},
+                {'ScheduledActionName': 'foo_once', 'Recurrence': None}
+            ],
+            bar_group['AutoScalingGroupName']: [
+                {'ScheduledActionName': 'bar_hourly', 'Recurrence': '0 * * * *'}
+            ]
+        }
+        self._mock_boto3_connection.describe_scheduled_actions.side_effect = (
+            lambda AutoScalingGroupName, **kwargs: {
+                'ScheduledUpdateGroupActions': actions[AutoScalingGroupName]
+            }
+        )
+
+        self._autoscale.delete_all_recurring_group_actions()
+
+        self.assertEqual(
+            sorted([
+                call(AutoScalingGroupName=foo_group['AutoScalingGroupName'], MaxRecords=100),
+                call(AutoScalingGroupName=bar_group['AutoScalingGroupName'], MaxRecords=100)
+            ]),
+            sorted(self._mock_boto3_connection.describe_scheduled_actions.call_args_list)
+        )
+        self.assertEqual(
+            sorted([
+                call(AutoScalingGroupName=foo_group['AutoScalingGroupName'], ScheduledActionName='foo_daily'),
+                call(AutoScalingGroupName=bar_group['AutoScalingGroupName'], ScheduledActionName='bar_hourly')
+            ]),
+            sorted(self._mock_boto3_connection.delete_scheduled_action.call_args_list)
+        )
+
     def test_get_launch_configs_filter(self):
         """get_launch_configs correctly filters out empty launch config names"""
         mock_groups = [
@@ -574,3 +845,151 @@ class DiscoAutoscaleTests(TestCase):
                     mock_groups[1]['LaunchConfigurationName']
                 ]
             )
+
+    def test_get_launch_configs_without_names(self):
+        """get_launch_configs does not describe every launch config when no group has one"""
+        mock_groups = [self.mock_group_dictionary("mhcfoo", launch_config_name="")]
+
+        with patch("disco_aws_automation.disco_autoscale.get_boto3_paged_results",
+                   MagicMock(return_value=mock_groups)):
+            self._autoscale.get_configs = MagicMock()
+
+            self.assertEqual([], self._autoscale.get_launch_configs(hostclass="mhcfoo"))
+            self._autoscale.get_configs.assert_not_called()
+
+    def test_create_launch_config_skips_unset_parameters(self):
+        """_create_launch_config leaves parameters without a value out of the AWS call"""
+        self._autoscale._create_launch_config(
+            name="us-moon-1_mhcfoo_abc", image_id="ami-foo", security_groups=["sg-foo"],
+            block_device_mappings=[], instance_type="m3.large", instance_monitoring=None,
+            instance_profile_name=None, ebs_optimized=False, user_data="", associate_public_ip_address=None
+        )
+
+        self._mock_boto3_connection.create_launch_configuration.assert_called_once_with(
+            LaunchConfigurationName="us-moon-1_mhcfoo_abc",
+            ImageId="ami-foo",
+            SecurityGroups=["sg-foo"],
+            BlockDeviceMappings=[],
+            InstanceType="m3.large",
+            InstanceMonitoring={'Enabled': False},
+            EbsOptimized=False,
+            UserData=""
+        )
+
+    def test_delete_groups_deletes_shared_config_once(self):
+        """delete_groups deletes the launch config of the deleted groups once"""
+        launch_config = self.mock_lg("mhcfoo")
+        groups = [
+            self.mock_group_dictionary("mhcfoo", name="us-moon-1_mhcfoo_1",
+                                       launch_config_name=launch_config['LaunchConfigurationName']),
+            self.mock_group_dictionary("mhcfoo", name="us-moon-1_mhcfoo_2",
+                                       launch_config_name=launch_config['LaunchConfigurationName'])
+        ]
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {'AutoScalingGroups': groups}
+
+        self._autoscale.delete_groups(hostclass="mhcfoo", force=True)
+
+        self._mock_boto3_connection.delete_auto_scaling_group.assert_has_calls(
+            [call(AutoScalingGroupName=group['AutoScalingGroupName'], ForceDelete=True) for group in groups],
+            any_order=True
+        )
+        self._mock_boto3_connection.delete_launch_configuration.assert_called_once_with(
+            LaunchConfigurationName=launch_config['LaunchConfigurationName']
+        )
+
+    def test_scaledown_groups(self):
+        """scaledown_groups scales every group of the hostclass down to zero"""
+        groups = [
+            self.mock_group_dictionary("mhcfoo", name="us-moon-1_mhcfoo_1"),
+            self.mock_group_dictionary("mhcfoo", name="us-moon-1_mhcfoo_2")
+        ]
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {'AutoScalingGroups': groups}
+
+        self._autoscale.scaledown_groups(hostclass="mhcfoo")
+
+        self._mock_boto3_connection.update_auto_scaling_group.assert_has_calls(
+            [
+                call(AutoScalingGroupName=group['AutoScalingGroupName'],
+                     MaxSize=0, MinSize=0, DesiredCapacity=0)
+                for group in groups
+            ],
+            any_order=True
+        )
+
+    def test_update_snapshot_describes_group_once(self):
+        """update_snapshot looks the group up only once when it switches to a new snapshot"""
+        mock_lc = self.mock_launchconfig(self._autoscale.environment_name, "mhcfoo")
+        mock_group = self.mock_group_dictionary("mhcfoo",
+                                                launch_config_name=mock_lc['LaunchConfigurationName'])
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [mock_group]
+        }
+        self._mock_boto3_connection.describe_launch_configurations.return_value = {
+            'LaunchConfigurations': [mock_lc]
+        }
+
+        self._autoscale.update_snapshot("snap-NEW", 99, hostclass="mhcfoo")
+
+        self.assertEqual(1, self._mock_boto3_connection.describe_auto_scaling_groups.call_count)
+        self.assertEqual(1, self._mock_boto3_connection.update_auto_scaling_group.call_count)
+
+    def test_scaledown_groups_waits_on_listed_instances(self):
+        """scaledown_groups waits on the group's own instances without listing every instance"""
+        group = self.mock_group_dictionary("mhcfoo")
+        group['Instances'] = [{'InstanceId': 'i-12345678'}]
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {'AutoScalingGroups': [group]}
+        mock_ec2 = MagicMock()
+        self._autoscale._boto3_ec = mock_ec2
+
+        self._autoscale.scaledown_groups(hostclass="mhcfoo", wait=True)
+
+        mock_ec2.get_waiter.return_value.wait.assert_called_once_with(InstanceIds=['i-12345678'])
+        self._mock_boto3_connection.describe_auto_scaling_instances.assert_not_called()
+
+    def test_scaledown_groups_waits_once_for_all_groups(self):
+        """scaledown_groups waits on the instances of every group with a single waiter"""
+        groups = [
+            self.mock_group_dictionary("mhcfoo", name="us-moon-1_mhcfoo_1"),
+            self.mock_group_dictionary("mhcfoo", name="us-moon-1_mhcfoo_2")
+        ]
+        groups[0]['Instances'] = [{'InstanceId': 'i-11111111'}]
+        groups[1]['Instances'] = [{'InstanceId': 'i-22222222'}]
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {'AutoScalingGroups': groups}
+        mock_ec2 = MagicMock()
+        self._autoscale._boto3_ec = mock_ec2
+
+        self.assertTrue(self._autoscale.scaledown_groups(hostclass="mhcfoo", wait=True))
+
+        mock_ec2.get_waiter.return_value.wait.assert_called_once_with(
+            InstanceIds=['i-22222222', 'i-11111111']
+        )
+
+    def test_wait_instance_termination_by_group_name(self):
+        """wait_instance_termination looks up the instances of a group given only by name"""
+        self._autoscale.get_instances = MagicMock(return_value=[{'instance_id': 'i-12345678'}])
+        mock_ec2 = MagicMock()
+        self._autoscale._boto3_ec = mock_ec2
+
+        self.assertTrue(self._autoscale.wait_instance_termination(group_name="us-moon-1_mhcfoo_1"))
+
+        self._autoscale.get_instances.assert_called_once_with(group_name="us-moon-1_mhcfoo_1")
+        mock_ec2.get_waiter.return_value.wait.assert_called_once_with(InstanceIds=['i-12345678'])
+
+    def test_clean_configs_skips_used_configs(self):
+        """clean_configs only deletes launch configs that no group uses"""
+        used_lc = self.mock_lg("mhcfoo")
+        unused_lc = self.mock_lg("mhcbar")
+        self._mock_boto3_connection.describe_auto_scaling_groups.return_value = {
+            'AutoScalingGroups': [
+                self.mock_group_dictionary("mhcfoo", launch_config_name=used_lc['LaunchConfigurationName'])
+            ]
+        }
+        self._mock_boto3_connection.describe_launch_configurations.return_value = {
+            'LaunchConfigurations': [used_lc, unused_lc]
+        }
+
+        self._autoscale.clean_configs()
+
+        self._mock_boto3_connection.delete_launch_configuration.assert_called_once_with(
+            LaunchConfigurationName=unused_lc['LaunchConfigurationName']
+        )
@@ -0,0 +1,31 @@
+"""Tests bin/disco_autoscale"""
+from unittest import TestCase
+
+from bin.disco_autoscale import parse_step_adjustment
+
+
+class DiscoAutoscaleCliTest(TestCase):
+    """Test bin/disco_autoscale"""
+
+    def test_parse_step_adjustment(self):
+        """parse_step_adjustment parses every key=value entry of a step"""
+        self.assertEqual(
+            {'MetricIntervalLowerBound': '0', 'MetricIntervalUpperBound': '', 'ScalingAdjustment': '1'},
+            parse_step_adjustment('MetricIntervalLowerBound=0,MetricIntervalUpperBound=,ScalingAdjustment=1')
+        )
+
+    def test_parse_step_adjustment_unknown_key(self):
+        """parse_step_adjustment raises on keys that aren't step adjustment keys"""
+        with self.assertRaises(Exception):
+            parse_step_adjustment('ScalingAdjustment=1,Foo=2')
+
+    def test_parse_step_adjustment_malformed_entry(self):
+        """parse_step_adjustment raises on entries that aren't key=value pairs"""
+        malformed_steps = [
+            'ScalingAdjustment:1',
+            'MetricIntervalLowerBound',
+            'ScalingAdjustment=1,MetricIntervalLowerBound'
+        ]
+        for step in malformed_steps:
+            with self.assertRaises(Exception):
+                parse_step_adjustment(step)
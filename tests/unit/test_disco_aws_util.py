@@ -1,6 +1,8 @@
 """
 Tests of disco_aws_util
 """
+import os
+import tempfile
 from unittest import TestCase
 from datetime import datetime
 
@@ -9,10 +11,12 @@ from mock import create_autospec
 
 from disco_aws_automation.disco_aws_util import (
     get_instance_launch_time,
+    read_pipeline_file,
     size_as_recurrence_map,
     size_as_minimum_int_or_none,
     size_as_maximum_int_or_none
 )
+from disco_aws_automation.exceptions import EasyExit
 
 
 class DiscoAWSUtilTests(TestCase):
@@ -90,3 +94,34 @@ class DiscoAWSUtilTests(TestCase):
         instance.launch_time = str(now)
 
         self.assertEqual(get_instance_launch_time(instance), now)
+
+    def _write_pipeline_file(self, content):
+        """Writes a temporary pipeline file, removed after the test"""
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as pipeline_file:
+            pipeline_file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_read_pipeline_file(self):
+        """read_pipeline_file returns a dict per line, skipping blank lines"""
+        path = self._write_pipeline_file("hostclass,min_size\nmhcfoo,1\n\nmhcbar,2\n")
+        self.assertEqual([{'hostclass': 'mhcfoo', 'min_size': '1'}, {'hostclass': 'mhcbar', 'min_size': '2'}],
+                         read_pipeline_file(path))
+
+    def test_read_pipeline_file_empty(self):
+        """read_pipeline_file raises EasyExit on an empty file"""
+        path = self._write_pipeline_file("")
+        with self.assertRaises(EasyExit):
+            read_pipeline_file(path)
+
+    def test_read_pipeline_file_short_row(self):
+        """read_pipeline_file fills in missing trailing fields with None"""
+        path = self._write_pipeline_file("hostclass,min_size,max_size\nmhcfoo,1\n")
+        self.assertEqual([{'hostclass': 'mhcfoo', 'min_size': '1', 'max_size': None}],
+                         read_pipeline_file(path))
+
+    def test_read_pipeline_file_extra_columns(self):
+        """read_pipeline_file drops fields that have no header"""
+        path = self._write_pipeline_file("hostclass,min_size\nmhcfoo,1,extra,more\n")
+        self.assertEqual([{'hostclass': 'mhcfoo', 'min_size': '1'}], read_pipeline_file(path))
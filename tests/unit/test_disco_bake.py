@@ -318,3 +318,11 @@ class DiscoBakeTests(TestCase):
         amis.append(self.mock_ami('mhcfoo 4', 'untested', 'astro', is_private=True))
         self._bake.get_amis = MagicMock(return_value=amis)
         self.assertEqual(self._bake.list_stragglers(), {"mhcfoo": amis[1]})
+
+    def test_get_image_fetches_once(self):
+        """Test get_image only asks AWS for an image the first time it is requested"""
+        ami = self.mock_ami('mhcfoo 1', 'untested')
+        self._bake.connection.get_image = MagicMock(return_value=ami)
+        self.assertEqual(self._bake.get_image(ami.id), ami)
+        self.assertEqual(self._bake.get_image(ami.id), ami)
+        self._bake.connection.get_image.assert_called_once_with(ami.id)
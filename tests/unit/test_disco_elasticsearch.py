@@ -119,6 +119,14 @@ class DiscoElastiSearchTests(TestCase):
         def _describe_elasticsearch_domain(DomainName):
             return self.domain_configs[DomainName]
 
+        # pylint doesn't like Boto3's argument names
+        # pylint: disable=C0103
+        def _describe_elasticsearch_domains(DomainNames):
+            return {
+                "DomainStatusList": [self.domain_configs[domain_name]["DomainStatus"]
+                                     for domain_name in DomainNames if domain_name in self.domain_configs]
+            }
+
         def _create_elasticsearch_domain(**config):
             domain_name = config["DomainName"]
             if domain_name in self.domain_configs:
@@ -148,6 +156,7 @@ class DiscoElastiSearchTests(TestCase):
         self._es._conn.list_domain_names.side_effect = _list_domain_names
         self._es._conn.delete_elasticsearch_domain.side_effect = _delete_elasticsearch_domain
         self._es._conn.describe_elasticsearch_domain.side_effect = _describe_elasticsearch_domain
+        self._es._conn.describe_elasticsearch_domains.side_effect = _describe_elasticsearch_domains
         self._es._conn.create_elasticsearch_domain.side_effect = _create_elasticsearch_domain
         self._es._conn.update_elasticsearch_domain_config.side_effect = _update_elasticsearch_domain_config
 
@@ -195,6 +204,17 @@ class DiscoElastiSearchTests(TestCase):
         self._es.update("logs")
         self.assertIn("elasticsearch_endpoint", self._es.list(include_endpoint=True)[0])
 
+    def test_list_domains_with_endpoints_batches_describe(self):
+        """If we list domains with endpoints, all domains should be described in a single call"""
+        self._es.update("logs")
+        self._es.update("other-logs")
+        domain_infos = self._es.list(include_endpoint=True)
+        self.assertEqual(
+            [self._get_endpoint(info["elasticsearch_domain_name"]) for info in domain_infos],
+            [info["elasticsearch_endpoint"] for info in domain_infos]
+        )
+        self.assertEqual(1, self._es.conn.describe_elasticsearch_domains.call_count)
+
     def test_get_endpoint_with_a_domain(self):
         """Verify that get_endpoint returns the correct endpoint for a domain"""
         elasticsearch_name = "logs"
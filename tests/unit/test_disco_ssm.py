@@ -442,6 +442,9 @@ class DiscoSSMTests(TestCase):
         # Calling the method under test
         self._ssm.update(wait=False)
 
+        # Verify each document file is read once, even though document_1 is both checked and recreated
+        self.assertEqual(2, mock_open.call_count)
+
         # Verify only document_1 is modified
         self.assertEqual(_standardize_json_str(new_doc_1_content),
                          _standardize_json_str(
@@ -685,6 +688,16 @@ class DiscoSSMTests(TestCase):
         self.assertEqual(True, is_successful)
         self.assertEqual(True, self._ssm.s3.get_object.called)
 
+    @patch('boto3.client', mock_boto3_client)
+    def test_execute_command_checks_s3_bucket_once(self):
+        """Verify that executing several commands only checks the S3 bucket once"""
+        instance_ids = ['i-1', 'i-2']
+
+        self._ssm.execute(instance_ids, "foo-doc")
+        self._ssm.execute(instance_ids, "foo-doc")
+
+        self._ssm.s3.head_bucket.assert_called_once_with(Bucket=MOCK_S3_BUCKET_NAME)
+
     @patch('boto3.client', mock_boto3_client)
     def test_execute_command_with_bad_s3(self):
         """Verify that we can execute a command with a bad S3 bucket"""
@@ -0,0 +1,75 @@
+"""Tests of disco_vpc_ui"""
+from argparse import Namespace
+from unittest import TestCase
+
+from mock import ANY, MagicMock, patch
+
+from disco_aws_automation import disco_vpc_ui
+
+
+class DiscoVPCUITests(TestCase):
+    """Test the disco_vpc command line"""
+
+    def setUp(self):
+        # Wrap every sub-command parser builder, to see which of them parse_arguments uses
+        self.builders = {
+            name: MagicMock(side_effect=builder) for name, builder in disco_vpc_ui.SUBPARSER_BUILDERS
+        }
+        builders_patcher = patch.object(
+            disco_vpc_ui, 'SUBPARSER_BUILDERS',
+            [(name, self.builders[name]) for name, _ in disco_vpc_ui.SUBPARSER_BUILDERS]
+        )
+        builders_patcher.start()
+        self.addCleanup(builders_patcher.stop)
+
+    def _parse(self, *argv):
+        with patch('sys.argv', ['disco_vpc.py'] + list(argv)):
+            return disco_vpc_ui.parse_arguments()
+
+    def test_mode_after_debug(self):
+        """parse_arguments finds the sub-command after --debug and only builds its parser"""
+        args = self._parse('--debug', 'list', '--type')
+
+        self.assertEqual('list', args.mode)
+        self.assertTrue(args.debug)
+        self.assertTrue(args.env_type)
+        self.builders['list'].assert_called_once_with(ANY)
+        for name, builder in self.builders.items():
+            if name != 'list':
+                builder.assert_not_called()
+
+    def test_help_without_mode(self):
+        """parse_arguments builds every sub-command parser for help without a sub-command"""
+        with patch('sys.stdout'):
+            with self.assertRaises(SystemExit) as context:
+                self._parse('-h')
+
+        self.assertEqual(0, context.exception.code)
+        for builder in self.builders.values():
+            builder.assert_called_once_with(ANY)
+
+    def test_peerings_requires_action(self):
+        """parse_arguments requires exactly one peerings action"""
+        with patch('sys.stderr'):
+            with self.assertRaises(SystemExit):
+                self._parse('peerings', '--name', 'foo')
+            with self.assertRaises(SystemExit):
+                self._parse('peerings', '--create', '--delete')
+
+        args = self._parse('peerings', '--list', '--name', 'foo')
+        self.assertTrue(args.list_peerings)
+        self.assertFalse(args.create_peerings)
+        self.assertEqual('foo', args.vpc_name)
+
+    @patch('disco_aws_automation.disco_vpc_ui.configure_logging', MagicMock())
+    def test_run_dispatches_to_command(self):
+        """run calls the command of the parsed sub-command"""
+        args = Namespace(mode='update', debug=False)
+        update_command = MagicMock()
+
+        with patch.object(disco_vpc_ui, 'parse_arguments', MagicMock(return_value=args)):
+            with patch.dict(disco_vpc_ui.COMMANDS, {'update': update_command}):
+                disco_vpc_ui.run()
+
+        update_command.assert_called_once_with(args)
+
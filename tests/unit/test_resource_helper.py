@@ -99,6 +99,16 @@ class ResourceHelperTests(TestCase):
         throttled_call(mock_func)
         self.assertEqual(3, mock_func.call_count)
 
+    @patch('time.sleep', return_value=None)
+    def test_throttled_call_clienterror_other_throttle_code(self, mock_sleep):
+        """Test throttle_call retries other throttling error codes"""
+        mock_func = MagicMock()
+        error_response = {"Error": {"Code": "ThrottlingException"}}
+        client_error = ClientError(error_response, "test")
+        mock_func.side_effect = [client_error, True]
+        throttled_call(mock_func)
+        self.assertEqual(2, mock_func.call_count)
+
     @patch('time.sleep', return_value=None)
     def test_throttled_call_clienterror_timeout(self, mock_sleep):
         """Test throttle_call using ClientError and timeout"""